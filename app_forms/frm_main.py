@@ -3,13 +3,15 @@ import sys
 import platform
 import os
 import json
-import dataclasses
-import subprocess
 
 from datetime import datetime, timedelta
-from time import time, sleep
+from time import time, monotonic
 from typing import Optional
 import re
+import weakref
+import webbrowser
+from contextlib import contextmanager
+from functools import partial, wraps
 
 from PyQt5.QtWidgets import (
   QApplication,
@@ -19,7 +21,6 @@ from PyQt5.QtWidgets import (
   QLabel,
   QGridLayout,
   QFrame,
-  QTextEdit,
   QDialog,
   QHBoxLayout,
   QSpacerItem,
@@ -52,22 +53,25 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import (
     Qt, QTimer, QSize, QThread, QObject, pyqtSignal, QUrl, QSettings,
-    QProcess, QPropertyAnimation, QModelIndex, QSortFilterProxyModel
+    QProcess, QPropertyAnimation, QModelIndex, QSortFilterProxyModel, QEvent,
+    QSignalBlocker
 )
 from PyQt5.QtGui import QFont, QIcon, QPixmap, QPainter
+import numpy as np
 import pyqtgraph as pg
-from PyQt5.QtSvg import QSvgRenderer
+from PyQt5 import sip
 
 from models.NodeInfo import NodeInfo
 from models.NodeHistory import NodeHistory
 from widgets.ToastWidget import ToastWidget, NotificationType
 from utils.const import *
 from utils.docker import _DockerUtilsMixin
-from utils.docker_commands import DockerCommandHandler
-from utils.updater import _UpdaterMixin
+from utils.docker_commands import DockerCommandHandler, DockerWorker
+from utils.updater import _UpdaterMixin, cached_latest_release
 from utils.system_resources import _SystemResourcesMixin
 from utils.docker_utils import get_volume_name, generate_container_name
-from utils.config_manager import ConfigManager, ContainerConfig
+from utils.config_manager import ConfigManager, ContainerConfig, format_address_label
+from utils.icon_helper import get_app_icon
 
 from utils.icon import ICON_BASE64
 
@@ -76,6 +80,7 @@ from app_forms.frm_utils import (
 )
 
 from ver import __VER__ as __version__
+from app_icons import get_copy_icon
 from widgets.dialogs.AuthorizedAddressedDialog import AuthorizedAddressesDialog
 from models.AllowedAddress import AllowedAddress, AllowedAddressList
 from models.StartupConfig import StartupConfig
@@ -85,55 +90,188 @@ from widgets.ModeSwitch import ModeSwitch
 from widgets.dialogs.DockerCheckDialog import DockerCheckDialog
 from widgets.CenteredComboBox import CenteredComboBox
 from widgets.LoadingDialog import LoadingDialog
+from widgets.DockerPullDialog import DockerPullDialog
 
 from ver import __VER__ as CURRENT_VERSION
 
 
 
+_IS_MACOS = platform.system().lower() == 'darwin'
+
+# Larger font size for info box labels and wider dropdowns on macOS
+_MACOS_STYLE = """
+  #infoBox QLabel {
+    font-size: 12pt !important;
+  }
+  #infoBoxText QLabel {
+    font-size: 12pt !important;
+  }
+  QComboBox QAbstractItemView {
+    min-width: 254px !important; /* Wider dropdown on macOS */
+  }
+  QPlainTextEdit#logView {
+    margin-bottom: 6px;
+  }
+"""
+
+# Node aliases: letters, numbers, hyphens and underscores only
+_ALIAS_RE = re.compile(r'\A[A-Za-z0-9_-]+\Z')
+
+# Technical prefixes stripped from rename errors: "Error:", then "Failed to"
+_ERR_PREFIX_RE = re.compile(r'\A(?:Error:\s*)?(?:Failed to)?')
+
+# Extracts the ID of the container holding a name from a docker "Conflict" error
+_CONTAINER_CONFLICT_RE = re.compile(r'by container "([^"]+)"')
+
+# Rename errors mapped to user-friendly messages, checked in order. Each entry
+# holds groups of lowercase needles; every group needs at least one match.
+_RENAME_ERROR_PATTERNS = (
+  ((("timeout", "timed out"),), "Operation timed out. Please check your connection and try again."),
+  ((("connection",), ("refused", "failed")), "Unable to connect to the node. Please ensure the container is running."),
+  ((("permission", "forbidden"),), "Permission denied. Please check your node permissions."),
+  ((("invalid",), ("name",)), "The provided name is invalid or not accepted by the node."),
+  ((("conflict", "already exists"),), "A node with this name already exists. Please choose a different name."),
+  ((("network",),), "Network error occurred. Please check your connection and try again."),
+  ((("not found", "404"),), "Node endpoint not found. The container may not be fully started."),
+  ((("bad request", "400"),), "Invalid request. Please check the node name format."),
+  ((("internal server error", "500"),), "Internal server error occurred. Please try again later."),
+)
+
+def _to_numeric_ts(timestamps):
+  """
+    Convert ISO timestamp strings to epoch seconds in a single vectorized pass.
+    :param timestamps: List of ISO format strings (or numbers)
+    :return: float64 array, or None if numpy cannot parse the strings
+  """
+  if not isinstance(timestamps[0], str):
+    return np.asarray(timestamps, dtype=np.float64)
+  try:
+    numeric = np.asarray(timestamps, dtype='datetime64[us]').astype(np.int64) * 1e-6
+    # numpy reads naive timestamps as UTC whereas datetime.timestamp() uses local
+    # time; shift the whole series by the offset observed on the first sample
+    numeric += datetime.fromisoformat(timestamps[0]).timestamp() - numeric[0]
+  except (ValueError, TypeError):
+    return None
+  return numeric
+
 def get_platform_and_os_info():
   platform_info = platform.platform()
   os_name = platform.system()
   os_version = platform.version()
   return platform_info, os_name, os_version
 
+_COLOR_CODES = {
+  "yellow": "\033[93m",
+  "red": "\033[91m",
+  "gray": "\033[90m",
+  "light": "\033[97m",
+  "green": "\033[92m",
+  "blue" : "\033[94m",
+  "cyan" : "\033[96m",
+}
+_COLOR_WRAPPERS = {name: code + "{}\033[0m" for name, code in _COLOR_CODES.items()}
+
 def log_with_color(message, color="gray"):
   """
     Log message with color in the terminal.
     :param message: Message to log
     :param color: Color of the message
   """
-  color_codes = {
-    "yellow": "\033[93m",
-    "red": "\033[91m",
-    "gray": "\033[90m",
-    "light": "\033[97m",
-    "green": "\033[92m",
-    "blue" : "\033[94m",
-    "cyan" : "\033[96m",
-  }
-  start_color = color_codes.get(color, "\033[90m")
-  end_color = "\033[0m"
-  print(f"{start_color}{message}{end_color}", flush=True)
+  print(_COLOR_WRAPPERS.get(color, _COLOR_WRAPPERS["gray"]).format(message), flush=True)
   return
 
+def _batched_ui_updates(method):
+  """
+    Run a form method inside `batch_ui_updates` so its widget changes repaint once.
+  """
+  @wraps(method)
+  def wrapper(self, *args, **kwargs):
+    with self.batch_ui_updates():
+      return method(self, *args, **kwargs)
+  return wrapper
+
 class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourcesMixin):
+  # Final application stylesheets keyed by (is_dark, is_macos)
+  _COMPILED_STYLESHEETS = {}
+
   def __init__(self, app_icon=None):
     self.logView = None
     self.log_buffer = []
+    self.loading_indicator = None  # created in initUI
     self.__force_debug = False
+    self._debug_enabled = False  # whether debug=True log lines are shown at all
+    self._plot_skipped_while_hidden = False  # set before Qt can deliver change/show events
     super().__init__()
 
+    # Log timestamp prefix, reformatted only when the second changes
+    self._ts_cached_sec = 0
+    self._ts_cached_str = ''
+
+    # Log lines are queued here and flushed to logView in batches
+    self._log_pending = []
+    self._log_flush_timer = QTimer(self)
+    self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+    self._log_flush_timer.timeout.connect(self._flush_log)
+    self._log_flush_timer.start()
+
     # Set current environment (you'll need to get this from your configuration)
     self.current_environment = DEFAULT_ENVIRONMENT
 
-    self.__current_node_uptime = -1
-    self.__current_node_epoch = -1
-    self.__current_node_epoch_avail = -1
-    self.__current_node_ver = -1
-    self.__display_uptime = None
+    self._current_node_uptime = -1
+    self._current_node_epoch = -1
+    self._current_node_epoch_avail = -1
+    self._current_node_ver = -1
+    self._display_uptime = None
+    self._last_epoch_avail = None
 
     self._current_stylesheet = DARK_STYLESHEET  # Default to dark theme
-    self.__last_plot_data = None
+    self._is_dark = True
+    self._applied_style_key = None
+    self._plot_bgs_cleared = False
+    self._plot_labels_state = {}  # plot attribute name -> last title set
+    self._plots_blank = True  # no curves drawn since the last clear
+    self._info_labels_blank = True  # uptime block shows its placeholders
+    self._batch_depth = 0  # nesting level of batch_ui_updates
+    self._last_cleared_for = None  # (container, loading) the display was last cleared for
+    self._copy_icon_cache = {}  # is_light_theme -> QIcon
+    self._copy_icon_applied = None
+    self._copy_icon_size = QSize(20, 20)
+
+    # Dialogs created by the launcher, closed together on shutdown
+    self._open_dialogs = weakref.WeakSet()
+
+    # UI updates batched by _schedule_ui_refresh
+    self._pending_ui_refresh = False
+    self._pending_ui_tasks = []
+    self._button_qss = {}  # (theme, style_type) -> stylesheet string
+    self._last_plot_data = None
+    self._pens = {}  # graph_*_color key -> QPen for the applied theme
+    self.__last_sample_hash = None
+
+    # Container running states maintained from the docker events stream
+    self._docker_events_process = None
+    self._docker_events_partial = ''
+    self._container_states = {}  # container name -> (exists, running)
+    self._refresh_snapshot = None  # (container name, exists, running) for the current refresh tick
+    self._is_running_cache = {}  # container name -> (monotonic time, (exists, running))
+    self._combo_index_by_name = {}  # container name -> container_combo index
+    self._node_info_inflight = None  # (container name, start time, [(on_success, on_error)])
+    self._post_start_polls = None  # remaining poll delays while waiting for an auto-restarted container
+    self._selected_container_name = None  # container name (combo item data) of the current selection
+    self._last_plot_ts = 0.0  # monotonic time of the last throttled plot_data dispatch
+    self._last_resources_ts = 0.0  # monotonic time of the last throttled resources refresh
+    self._toggle_state_cache = None  # (container name, running, theme) last applied to toggleButton
+    self._container_name_set_cache = None  # (monotonic time, frozenset of `docker ps -a` names)
+    self._clipboard = QApplication.clipboard()
+    self._rename_dialog = None  # built on first use by show_rename_dialog
+    self.docker_pull_dialog = None  # built on first pull, then reused
+    self.launcher_dialog = None
+    self.startup_dialog = None
+    self.toggle_dialog = None
+    self._rename_input = None
+    self._rename_container_name = None
+    self._rename_dialog_theme = None
+    self._rename_restart_inflight = False
     self.__last_auto_update_check = 0
 
     # Track update process state to prevent duplicate notifications
@@ -144,7 +282,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     self.__docker_pull_in_progress = False
     
     self.__version__ = __version__
-    self.__last_timesteps = []
     self._icon = get_icon_from_base64(ICON_BASE64)
     self.setWindowIcon(self._icon)
     
@@ -152,12 +289,12 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     self.init_button_colors()
 
     self.runs_in_production = self.is_running_in_production()
+    self._refresh_debug_enabled()
 
     # Set the application icon - use the provided icon directly
     self._icon = app_icon
     if self._icon is None:
       # Only fall back to base64 if no icon provided
-      from utils.icon_helper import get_app_icon
       self._icon = get_app_icon()
       self.add_log("Loaded application icon via helper", debug=True)
     else:
@@ -171,6 +308,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
     # Initialize force debug from saved settings
     self.__force_debug = self.config_manager.get_force_debug()
+    self._refresh_debug_enabled()
 
     self.initUI()
     
@@ -207,23 +345,8 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     # Track failed get_node_info requests for auto-restart
     self.node_info_failure_count = 0
     
-    # Check if container is running and update UI accordingly
-    if self.is_container_running():
-        self.add_log("Container is running on startup, updating UI", debug=True)
-        # Clear the stop flag since container is already running
-        self.user_stopped_container = False
-        self.post_launch_setup()
-        self.refresh_node_info()
-        self.plot_data()  # Initial plot
-    else:
-        self.add_log("No running container found on startup", debug=True)
-
-    # Ensure button state is correct
-    self.update_toggle_button_text()
-
     self.timer = QTimer(self)
     self.timer.timeout.connect(self.refresh_all)
-    self.timer.start(REFRESH_TIME)  # Refresh every 10 seconds
     self.toast = ToastWidget(self)
 
     # Initialize copy button icons based on current theme
@@ -232,19 +355,143 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     # Initialize system resources display
     self.update_resources_display()
 
-    # Perform initial force refresh to get the latest data
-    if self.container_combo.count() > 0:
-        self.add_log("Performing initial force refresh on startup...", color="blue")
-        # Use a timer to ensure UI is fully initialized before refreshing
-        QTimer.singleShot(500, self.force_refresh_all)
+    # Probe the selected container off the GUI thread; the UI is updated in
+    # _apply_startup_container_state once docker answers
+    self._startup_worker = None
+    self._probe_startup_container_state()
+
+    # React to container state transitions as soon as docker reports them
+    self._docker_event_refresh_timer = QTimer(self)
+    self._docker_event_refresh_timer.setSingleShot(True)
+    self._docker_event_refresh_timer.setInterval(DOCKER_EVENT_REFRESH_DELAY)
+    self._docker_event_refresh_timer.timeout.connect(self._refresh_after_docker_event)
+    self._start_docker_events_watcher()
+
+    # Perform initial update check once the window has settled
+    self._update_worker = None
+    self._update_check_verbose = True
+    self._update_check_cached = False
+    QTimer.singleShot(UPDATE_CHECK_STARTUP_DELAY, lambda: self.check_for_updates(verbose=True))
+
+  def _probe_startup_container_state(self):
+    """Check whether the selected container is running using a pool worker."""
+    container_name = self._selected_container_name
+    if not container_name:
+      self._apply_startup_container_state(False)
+      return
+    self.docker_handler.set_container_name(container_name)
+    self._startup_worker = DockerWorker(self.docker_handler.is_container_running, container_name)
+    self._startup_worker.signals.result.connect(self._apply_startup_container_state)
+    self._startup_worker.signals.error.connect(lambda _: self._apply_startup_container_state(False))
+    self._startup_worker.start()
+    return
+
+  def _apply_startup_container_state(self, is_running):
+    """Update the UI with the startup container state (runs on the GUI thread)."""
+    self._startup_worker = None
+    self.container_last_run_status = bool(is_running)
+    if is_running:
+      # Seed the short-lived state cache so the setup calls below reuse the probe result
+      self._is_running_cache[self.docker_handler.container_name] = (monotonic(), (True, True))
+      self.add_log("Container is running on startup, updating UI", debug=True)
+      # Clear the stop flag since container is already running
+      self.user_stopped_container = False
+      self.post_launch_setup()
+      self.refresh_node_info()
+      self.plot_data()  # Initial plot
+    else:
+      self.add_log("No running container found on startup", debug=True)
+
+    # Ensure button state is correct
+    self.update_toggle_button_text()
+
+    # Start periodic refresh only once the initial state is known
+    self.timer.start(REFRESH_TIME)  # Refresh every 10 seconds
+    return
+
+  def _start_docker_events_watcher(self):
+    """Stream `docker events` for containers through a long-lived QProcess."""
+    self._docker_events_partial = ''
+    # Anything cached before this stream started may be stale
+    self._container_states.clear()
+    self._docker_events_process = QProcess(self)
+    self._docker_events_process.readyReadStandardOutput.connect(self._on_docker_events_output)
+    self._docker_events_process.finished.connect(self._on_docker_events_finished)
+    self._docker_events_process.start('docker', [
+      'events', '--filter', 'type=container', '--format', '{{json .}}'
+    ])
+    self.add_log('Started docker events watcher', debug=True)
+    return
+
+  def _on_docker_events_finished(self, exit_code, exit_status):
+    """Restart the events watcher unless the application is shutting down."""
+    if self._docker_events_process is None:
+      return
+    self.debug_log('Docker events watcher exited with code %s, restarting', exit_code)
+    self._docker_events_process.deleteLater()
+    self._docker_events_process = None
+    self._container_states.clear()
+    QTimer.singleShot(DOCKER_EVENTS_RESTART_DELAY, self._start_docker_events_watcher)
+    return
+
+  def _on_docker_events_output(self):
+    """Parse docker event lines and schedule a refresh for the selected container."""
+    data = bytes(self._docker_events_process.readAllStandardOutput()).decode('utf-8', errors='replace')
+    lines = (self._docker_events_partial + data).split('\n')
+    self._docker_events_partial = lines.pop()
+    selected = self._selected_container_name
+    for line in lines:
+      if not line.strip():
+        continue
+      try:
+        event = json.loads(line)
+      except ValueError:
+        continue
+      action = event.get('Action') or event.get('status', '')
+      name = event.get('Actor', {}).get('Attributes', {}).get('name')
+      if action == 'start':
+        self._container_states[name] = (True, True)
+      elif action in ('create', 'die'):
+        self._container_states[name] = (True, False)
+      elif action == 'destroy':
+        self._container_states.pop(name, None)
+      if action in ('create', 'destroy'):
+        # The set of existing containers changed
+        self._container_name_set_cache = None
+      if name == selected and action in DOCKER_EVENT_ACTIONS:
+        self.debug_log('Docker event: container %s %s', name, action)
+        # Coalesce bursts (die/stop/kill) into a single refresh
+        self._docker_event_refresh_timer.start()
+    return
+
+  def _refresh_after_docker_event(self):
+    """Update the display after a docker event on the selected container.
+
+    Display-only: unlike refresh_all it never auto-starts the container, since the
+    event may come from a launch or stop that is still in flight (the destroy of the
+    old container before `docker run`, or the die before the stop callback runs).
+    """
+    if self.__docker_pull_in_progress:
+      return
+    self._refresh_local_containers()
 
-    # Perform initial update check on startup
-    self.check_for_updates(verbose=True)
+  def _docker_events_streaming(self):
+    """True while the docker events stream is alive and can be trusted."""
+    process = self._docker_events_process
+    return process is not None and process.state() == QProcess.Running
+
+  def _stop_docker_events_watcher(self):
+    process = self._docker_events_process
+    self._docker_events_process = None
+    self._container_states.clear()
+    if process is not None:
+      process.kill()
+      process.waitForFinished(1000)
+    return
 
   def init_button_colors(self):
     """Initialize or update button colors based on current theme"""
-    is_dark = self._current_stylesheet == DARK_STYLESHEET
-    colors = DARK_COLORS if is_dark else LIGHT_COLORS
+    colors = DARK_COLORS if self._is_dark else LIGHT_COLORS
     
     self.button_colors = {
         'start': {
@@ -285,36 +532,48 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         }
     }
 
-  def apply_button_style(self, button, style_type):
-    """Apply button style based on button colors and state
-    
-    Args:
-        button: The button to style
-        style_type: The type of style to apply ('start', 'stop', 'disabled')
-    """
+    # Format the stylesheets once per theme; apply_button_style only looks them up
+    theme = self._theme_key
+    for style_type, style_colors in self.button_colors.items():
+      if (theme, style_type) not in self._button_qss:
+        self._button_qss[(theme, style_type)] = self._build_button_qss(style_type, style_colors)
+    return
+
+  @property
+  def _theme_key(self):
+    return 'dark' if self._is_dark else 'light'
+
+  @staticmethod
+  def _build_button_qss(style_type, style_colors):
+    """Build the stylesheet for a button style from its colors."""
     if style_type == 'disabled':
-        button.setStyleSheet(f"background-color: {self.button_colors['disabled']['bg']}; color: {self.button_colors['disabled']['text']};")
-        return
-    
-    # Check if the style type has a hover property
-    has_hover = 'hover' in self.button_colors[style_type]
-    
+      return f"background-color: {style_colors['bg']}; color: {style_colors['text']};"
+
     hover_css = f"""
         QPushButton:hover {{
-            background-color: {self.button_colors[style_type]['hover']};
+            background-color: {style_colors['hover']};
         }}
-    """ if has_hover else ""
-    
-    button.setStyleSheet(f"""
+    """ if 'hover' in style_colors else ""
+
+    return f"""
         QPushButton {{
-            background-color: {self.button_colors[style_type]['bg']};
-            color: {self.button_colors[style_type]['text']};
-            border: 2px solid {self.button_colors[style_type]['border']};
+            background-color: {style_colors['bg']};
+            color: {style_colors['text']};
+            border: 2px solid {style_colors['border']};
             padding: 5px 10px;
             border-radius: 15px;
         }}
         {hover_css}
-    """)
+    """
+
+  def apply_button_style(self, button, style_type):
+    """Apply button style based on button colors and state
+    
+    Args:
+        button: The button to style
+        style_type: The type of style to apply ('start', 'stop', 'disabled')
+    """
+    button.setStyleSheet(self._button_qss[(self._theme_key, style_type)])
 
   def check_docker_with_ui(self):
     """Check Docker status and handle UI interactions.
@@ -371,19 +630,39 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
   
   
   def add_log(self, line, debug=False, color="gray"):
-    show = (debug and not self.runs_in_production) or not debug
-    show = show or self.__force_debug
+    show = not debug or self._debug_enabled
     if show:      
-      timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-      line = f'{timestamp} {line}'
+      sec = int(time())
+      if sec != self._ts_cached_sec:
+        self._ts_cached_str = datetime.fromtimestamp(sec).strftime("[%Y-%m-%d %H:%M:%S]")
+        self._ts_cached_sec = sec
+      line = f'{self._ts_cached_str} {line}'
       if self.logView is not None:
-        self.logView.append(line)
+        self._log_pending.append(line)
       else:
         self.log_buffer.append(line)
-      QApplication.processEvents()  # Flush the event queue
       if debug or self.__force_debug:
         log_with_color(line, color=color)
     return  
+
+  def _refresh_debug_enabled(self):
+    self._debug_enabled = not self.runs_in_production or self.__force_debug
+
+  def debug_log(self, msg, *args, color="gray"):
+    """Log a debug line, formatting `msg % args` only if debug lines are shown."""
+    if not self._debug_enabled:
+      return
+    if args:
+      msg = msg % args
+    self.add_log(msg, debug=True, color=color)
+
+  def _flush_log(self):
+    """Append all pending log lines to the log view in a single call."""
+    if not self._log_pending or self.logView is None:
+      return
+    self.logView.appendPlainText('\n'.join(self._log_pending))
+    self._log_pending.clear()
+    return
   
   def center(self):
     screen_geometry = QApplication.desktop().screenGeometry()
@@ -455,11 +734,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     # Container dropdown
     self.container_combo = CenteredComboBox()
     self.container_combo.setFont(QFont("Courier New", 10))
+    # Keep the cached selection in sync before the selection handler runs
+    self.container_combo.currentIndexChanged.connect(self._sync_selected_container)
     self.container_combo.currentTextChanged.connect(self._on_container_selected)
     self.container_combo.setMinimumHeight(32)  # Make dropdown slightly taller
     
     # Set the initial theme directly
-    is_dark = self._current_stylesheet == DARK_STYLESHEET
+    is_dark = self._is_dark
     if hasattr(self.container_combo, 'set_theme'):
         self.container_combo.set_theme(is_dark)
     container_selector_layout.addWidget(self.container_combo)
@@ -649,7 +930,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     self.force_debug_checkbox.setFont(QFont("Courier New", 9, QFont.Bold))
     
     # Apply custom styling to the debug checkbox
-    is_dark = self._current_stylesheet == DARK_STYLESHEET
+    is_dark = self._is_dark
     if is_dark:
         self.force_debug_checkbox.setStyleSheet(DETAILED_CHECKBOX_STYLE.format(
             debug_checkbox_color=DARK_COLORS["debug_checkbox_color"]
@@ -664,8 +945,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
     bottom_button_area.addStretch()
     menu_layout.addLayout(bottom_button_area)
-    
-    content_widget.layout().addWidget(menu_widget)
 
     # Right panel with mode switch overlay
     right_container = QWidget()
@@ -704,6 +983,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     self.memory_plot = pg.PlotWidget()
     self.gpu_plot = pg.PlotWidget()
     self.gpu_memory_plot = pg.PlotWidget()
+
+    # Date axes are created once; plot_graphs only refreshes their timestamps
+    self._date_axes = {}
+    for key, plot in (("cpu", self.cpu_plot), ("mem", self.memory_plot),
+                      ("gpu", self.gpu_plot), ("gpu_mem", self.gpu_memory_plot)):
+        self._date_axes[key] = DateAxisItem(orientation='bottom')
+        plot.setAxisItems({'bottom': self._date_axes[key]})
     
     # Create layouts for containers
     cpu_layout = QVBoxLayout(cpu_container)
@@ -731,33 +1017,25 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     self.graphView.setLayout(graph_layout)
     right_panel_layout.addWidget(self.graphView)
 
-    graph_layout.addWidget(self.cpu_plot, 0, 0)
-    graph_layout.addWidget(self.memory_plot, 0, 1)
-    graph_layout.addWidget(self.gpu_plot, 1, 0)
-    graph_layout.addWidget(self.gpu_memory_plot, 1, 1)
-    
-    self.graphView.setLayout(graph_layout)
-    right_panel_layout.addWidget(self.graphView)
-
     right_panel_layout.setSpacing(10)
 
     # the log scroll text area
-    self.logView = QTextEdit()
+    self.logView = QPlainTextEdit()
+    self.logView.setObjectName("logView")  # Styled through the window stylesheet
     self.logView.setReadOnly(True)
-    self.logView.setStyleSheet(self._current_stylesheet)
+    self.logView.setMaximumBlockCount(LOG_MAX_BLOCK_COUNT)
     self.logView.setFixedHeight(150)
     self.logView.setFont(QFont("Courier New"))
     right_panel_layout.addWidget(self.logView)
     if self.log_buffer:
-        for line in self.log_buffer:
-            self.logView.append(line)
+        self.logView.appendPlainText('\n'.join(self.log_buffer))
         self.log_buffer = []
 
     right_container_layout.addWidget(right_panel)
     
     # Add the main content widgets
     content_widget.layout().addWidget(menu_widget)
-    content_widget.layout().addWidget(right_container)
+    content_widget.layout().addWidget(right_container, 1)
     
     main_layout.addWidget(content_widget)
 
@@ -767,7 +1045,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     return
   
   def toggle_theme(self):
-    if self._current_stylesheet == DARK_STYLESHEET:
+    if self._is_dark:
         self._current_stylesheet = LIGHT_STYLESHEET
         self.themeToggleButton.setText(DARK_DASHBOARD_BUTTON_TEXT)
         self.force_debug_checkbox.setProperty('class', 'light')
@@ -777,6 +1055,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.themeToggleButton.setText(LIGHT_DASHBOARD_BUTTON_TEXT)
         self.force_debug_checkbox.setProperty('class', 'dark')
         is_dark = True
+    self._is_dark = is_dark
     
     # Update button colors for the new theme
     self.init_button_colors()
@@ -810,6 +1089,26 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     # Update resources display for theme consistency
     self.update_resources_display()
 
+  def _is_window_hidden(self):
+    """Return True if the main window is hidden or minimized."""
+    return not self.isVisible() or bool(self.windowState() & Qt.WindowMinimized)
+
+  def _catch_up_plots(self):
+    """Re-run plot_data once if it was skipped while the window was hidden or minimized."""
+    if self._plot_skipped_while_hidden and not self._is_window_hidden():
+      self._plot_skipped_while_hidden = False
+      QTimer.singleShot(0, self.plot_data)
+
+  def showEvent(self, event):
+    super().showEvent(event)
+    self._catch_up_plots()
+
+  def changeEvent(self, event):
+    super().changeEvent(event)
+    if event.type() == QEvent.WindowStateChange:
+      # Restored from minimized; showEvent may fire too, the flag makes it one catch-up
+      self._catch_up_plots()
+
   def closeEvent(self, event):
     """Handle application close event with proper cleanup."""
     try:
@@ -820,31 +1119,27 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             self.timer.stop()
             self.add_log("Stopped main refresh timer", debug=True)
         
+        # Stop the docker events stream
+        if self._docker_events_process is not None:
+            self._stop_docker_events_watcher()
+            self.add_log("Stopped docker events watcher", debug=True)
+
         # Stop any loading indicators
-        if hasattr(self, 'loading_indicator') and self.loading_indicator:
+        if self.loading_indicator is not None:
             self.loading_indicator.stop()
             self.add_log("Stopped loading indicators", debug=True)
         
         # Close any open dialogs forcefully
-        dialog_attrs = ['startup_dialog', 'launcher_dialog', 'toggle_dialog', 'docker_pull_dialog']
-        for dialog_attr in dialog_attrs:
-            if hasattr(self, dialog_attr):
-                dialog = getattr(self, dialog_attr)
-                if dialog and hasattr(dialog, 'close'):
-                    try:
-                        dialog.close()
-                        self.add_log(f"Closed {dialog_attr}", debug=True)
-                    except Exception as e:
-                        self.add_log(f"Error closing {dialog_attr}: {str(e)}", debug=True)
-        
-        # Force close any remaining child widgets
-        try:
-            for child in self.findChildren(QDialog):
-                if child and child.isVisible():
-                    child.close()
-                    self.add_log(f"Force closed dialog: {type(child).__name__}", debug=True)
-        except Exception as e:
-            self.add_log(f"Error force closing dialogs: {str(e)}", debug=True)
+        for dialog in list(self._open_dialogs):
+            try:
+                if dialog.isVisible():
+                    dialog.close()
+                    self.add_log(f"Closed dialog: {type(dialog).__name__}", debug=True)
+            except RuntimeError:
+                # The underlying Qt object is already gone
+                pass
+            except Exception as e:
+                self.add_log(f"Error closing dialog: {str(e)}", debug=True)
         
         # Process any remaining events
         try:
@@ -876,64 +1171,36 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         if app:
             app.closeAllWindows()
         
-        # Force exit at OS level (only this GUI process)
-        import os
-        import signal
-        
-        if os.name == 'nt':  # Windows
-            try:
-                import subprocess
-                current_pid = os.getpid()
-                # Kill only our GUI process
-                subprocess.run(['taskkill', '/F', '/PID', str(current_pid)], 
-                             capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            except:
-                os._exit(0)
-        else:
-            # Unix systems
-            try:
-                os.kill(os.getpid(), signal.SIGTERM)
-            except:
-                os._exit(0)
+        # Force exit at OS level (only this GUI process). os._exit terminates
+        # immediately on every platform without spawning taskkill or routing
+        # SIGTERM back through the Qt event loop.
+        logging.shutdown()
+        os._exit(0)
                 
     except:
         # Absolute last resort
-        import os
         os._exit(0)
 
   def update_copy_button_icons(self):
     """Update the copy button icons based on the current theme."""
     try:
-      # Import the icon module - handle both relative and absolute imports
-      try:
-        # Try relative import first (works in development)
-        import sys
-        from pathlib import Path
-        
-        # Add parent directory to path if needed
-        parent_dir = Path(__file__).resolve().parent.parent
-        if str(parent_dir) not in sys.path:
-            sys.path.append(str(parent_dir))
-            
-        from app_icons import get_copy_icon
-      except ImportError:
-        # Fallback for packaged app
-        from app_icons import get_copy_icon
-        
       # Determine if we're using light theme
-      is_light_theme = self._current_stylesheet == LIGHT_STYLESHEET
-      
-      # Get the icon with appropriate color
-      copy_icon = get_copy_icon(is_light_theme)
+      is_light_theme = not self._is_dark
+      if is_light_theme == self._copy_icon_applied:
+        return
       
-      # Set icon size
-      icon_size = QSize(20, 20)
+      # Get the icon with appropriate color, rendering each theme's SVG only once
+      copy_icon = self._copy_icon_cache.get(is_light_theme)
+      if copy_icon is None:
+        copy_icon = get_copy_icon(is_light_theme)
+        self._copy_icon_cache[is_light_theme] = copy_icon
       
       # Apply to buttons
       self.copyAddrButton.setIcon(copy_icon)
-      self.copyAddrButton.setIconSize(icon_size)
+      self.copyAddrButton.setIconSize(self._copy_icon_size)
       self.copyEthButton.setIcon(copy_icon)
-      self.copyEthButton.setIconSize(icon_size)
+      self.copyEthButton.setIconSize(self._copy_icon_size)
+      self._copy_icon_applied = is_light_theme
       
     except Exception as e:
       # Log error and fallback to text
@@ -952,56 +1219,52 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.copyEthButton.setText("Copy")
 
   def change_text_color(self):
-    if self._current_stylesheet == DARK_STYLESHEET:
+    if self._is_dark:
       self.force_debug_checkbox.setStyleSheet(DETAILED_CHECKBOX_STYLE.format(debug_checkbox_color=DARK_COLORS["debug_checkbox_color"]))
     else:
       self.force_debug_checkbox.setStyleSheet(DETAILED_CHECKBOX_STYLE.format(debug_checkbox_color=LIGHT_COLORS["debug_checkbox_color"]))
 
   def apply_stylesheet(self):
-    is_dark = self._current_stylesheet == DARK_STYLESHEET
-    self.logView.setObjectName("logView")  # Set object name for logView
+    key = (self._is_dark, _IS_MACOS)
+    if key == self._applied_style_key:
+      return
     self.change_text_color()
 
-    # Apply larger font size for info box labels on macOS
-    if platform.system().lower() == 'darwin':
-      # Additional macOS-specific styles
-      macos_style = """
-        #infoBox QLabel {
-          font-size: 12pt !important;
-        }
-        #infoBoxText QLabel {
-          font-size: 12pt !important;
-        }
-        QComboBox QAbstractItemView {
-          min-width: 254px !important; /* Wider dropdown on macOS */
-        }
-      """
-      # Apply base stylesheet plus macOS modifications
-      self.setStyleSheet(self._current_stylesheet + macos_style)
-      
-      # Apply margin directly to logView with its own stylesheet
-      self.logView.setStyleSheet("""
-        QTextEdit#logView {
-          margin-bottom: 6px;
-        }
-      """)
-    else:
-      # Apply regular stylesheet for other platforms
-      self.setStyleSheet(self._current_stylesheet)
-      self.logView.setStyleSheet("")
+    stylesheet = self._COMPILED_STYLESHEETS.get(key)
+    if stylesheet is None:
+      if _IS_MACOS:
+        # Apply base stylesheet plus macOS modifications
+        stylesheet = self._current_stylesheet + _MACOS_STYLE
+      else:
+        # Apply regular stylesheet for other platforms
+        stylesheet = self._current_stylesheet
+      self._COMPILED_STYLESHEETS[key] = stylesheet
+
+    # Install the theme once on the application; every widget and dialog picks
+    # it up from there instead of holding its own copy
+    QApplication.instance().setStyleSheet(stylesheet)
+    self._applied_style_key = key
+
+    # Build the plot pens for this theme once instead of on every plot refresh
+    colors = DARK_COLORS if self._is_dark else LIGHT_COLORS
+    self._pens = {
+      name: pg.mkPen(color, width=1)
+      for name, color in colors.items()
+      if name.startswith('graph_') and name.endswith('_color')
+    }
     
-    # Reset plot backgrounds
-    self.cpu_plot.setBackground(None)
-    self.memory_plot.setBackground(None)
-    self.gpu_plot.setBackground(None)
-    self.gpu_memory_plot.setBackground(None)
+    # Reset plot backgrounds so the stylesheet shows through; once is enough
+    # since every later theme only changes the stylesheet behind them
+    if not self._plot_bgs_cleared:
+      self.cpu_plot.setBackground(None)
+      self.memory_plot.setBackground(None)
+      self.gpu_plot.setBackground(None)
+      self.gpu_memory_plot.setBackground(None)
+      self._plot_bgs_cleared = True
 
   def toggle_container(self):
     """Toggle the Docker container state (start/stop)."""
     try:
-        # Get the current container name
-        container_name = self.docker_handler.container_name
-        
         # Check if container is running
         is_running = self.is_container_running()
         
@@ -1018,6 +1281,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
   def _stop_container(self):
     """Stop the Docker container."""
+    self._last_cleared_for = None
     try:
         # Get the current container name
         container_name = self.docker_handler.container_name
@@ -1032,23 +1296,14 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             message = "Please wait while Edge Node is being stopped..."
             
         # Show loading dialog for stopping operation
-        self.toggle_dialog = LoadingDialog(
-            self, 
-            title="Stopping Node", 
-            message=message,
-            size=50
-        )
-        self.toggle_dialog.show()
-        
-        # Update message to indicate starting the stop process
-        self.toggle_dialog.update_progress("Preparing to stop Docker container...")
+        self._show_loading_dialog('toggle_dialog', "Stopping Node", message, progress="Preparing to stop Docker container...")
         
         # Clear info displays
         self._clear_info_display()
         self.loading_indicator.start()
         
         # Update loading dialog with progress
-        if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible():
+        if self._dialog_visible('toggle_dialog'):
             self.toggle_dialog.update_progress("Stopping Docker container...")
         
         # Define success callback for threaded operation
@@ -1063,38 +1318,31 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             
             # Mark that user intentionally stopped the container to prevent auto-restart
             self.user_stopped_container = True
+            self._invalidate_container_state(container_name)
             
             # Update loading dialog with progress    
-            if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible():
+            toggle_dialog_visible = self._dialog_visible('toggle_dialog')
+            if toggle_dialog_visible:
                 self.toggle_dialog.update_progress("Container stopped, updating UI...")
                 
-            # Clear and update all UI elements
-            self.update_toggle_button_text()
-            self.refresh_node_info()  # Updates address displays with cached data
-            self.maybe_refresh_uptime()   # Updates uptime displays
-            self.plot_data()              # Clears plots
-            
-            # Stop loading indicator
-            self.loading_indicator.stop()
+            # Clear and update all UI elements in a single pass of the event loop
+            self._schedule_ui_refresh([
+                self.update_toggle_button_text,
+                self.refresh_node_info,     # Updates address displays with cached data
+                self.maybe_refresh_uptime,  # Updates uptime displays
+                self.plot_data,             # Clears plots
+                self.loading_indicator.stop,
+            ])
             
             # Update loading dialog with completion message
-            if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible():
+            if toggle_dialog_visible:
                 self.toggle_dialog.update_progress("Container stopped successfully!")
                 
             # Close the loading dialog after a short delay to show success message
-            toggle_dialog_visible = hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible()
             if toggle_dialog_visible:
-                QTimer.singleShot(500, lambda: self.toggle_dialog.safe_close() if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None else None)
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(1000, lambda: setattr(self, 'toggle_dialog', None) if hasattr(self, 'toggle_dialog') else None)
+                self._finalize_dialog('toggle_dialog', 500)
             
-            # Process events to ensure immediate UI update
-            QApplication.processEvents()
-            
-            # Show success notification
-            # Get node alias from config if available
-            node_display_name = container_name
-            container_config = self.config_manager.get_container(container_name)
+            # Show success notification using the config captured above
             if container_config and container_config.node_alias:
                 node_display_name = container_config.node_alias
                 self.toast.show_notification(NotificationType.SUCCESS, f"Node '{node_display_name}' stopped successfully")
@@ -1107,15 +1355,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             self.loading_indicator.stop()
             
             # Update loading dialog with error message
-            if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible():
+            toggle_dialog_visible = self._dialog_visible('toggle_dialog')
+            if toggle_dialog_visible:
                 self.toggle_dialog.update_progress(f"Error: {error_msg}")
                 
             # Close the loading dialog after a short delay to show error message
-            toggle_dialog_visible = hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible()
             if toggle_dialog_visible:
-                QTimer.singleShot(1500, lambda: self.toggle_dialog.safe_close() if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None else None)
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(2000, lambda: setattr(self, 'toggle_dialog', None) if hasattr(self, 'toggle_dialog') else None)
+                self._finalize_dialog('toggle_dialog', 1500)
                 
             self.add_log(f"Error stopping container: {error_msg}", color="red")
             self.toast.show_notification(NotificationType.ERROR, f"Error stopping container: {error_msg}")
@@ -1128,24 +1374,124 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.loading_indicator.stop()
         
         # Update loading dialog with error message
-        if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible():
+        toggle_dialog_visible = self._dialog_visible('toggle_dialog')
+        if toggle_dialog_visible:
             self.toggle_dialog.update_progress(f"Error: {str(e)}")
             
         # Close the loading dialog after a short delay to show error message
-        toggle_dialog_visible = hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None and self.toggle_dialog.isVisible()
         if toggle_dialog_visible:
-            QTimer.singleShot(1500, lambda: self.toggle_dialog.safe_close() if hasattr(self, 'toggle_dialog') and self.toggle_dialog is not None else None)
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(2000, lambda: setattr(self, 'toggle_dialog', None) if hasattr(self, 'toggle_dialog') else None)
+            self._finalize_dialog('toggle_dialog', 1500)
             
         self.add_log(f"Error stopping container: {str(e)}", color="red")
         self.toast.show_notification(NotificationType.ERROR, f"Error stopping container: {str(e)}")
 
+  def _show_loading_dialog(self, attr, title, message, progress=None):
+    """Create, track and show a LoadingDialog stored in `attr`, optionally posting a first progress step."""
+    dialog = LoadingDialog(self, title=title, message=message, size=50)
+    setattr(self, attr, dialog)
+    self._track_dialog(dialog)
+    dialog.show()
+    if progress is not None:
+      dialog.update_progress(progress)
+    return dialog
+
+  def _dialog_visible(self, attr):
+    """Return True if the dialog stored in `attr` exists and is visible."""
+    dialog = getattr(self, attr)
+    return dialog is not None and dialog.isVisible()
+
+  def _progress(self, msg):
+    """Show `msg` on the launcher dialog, or on the startup dialog if that is the one showing."""
+    if self.launcher_dialog is not None:
+      self.launcher_dialog.update_progress(msg)
+    elif self.startup_dialog is not None and self.startup_dialog.isVisible():
+      self.startup_dialog.update_progress(msg)
+
+  def _close_dialogs(self):
+    """Close the launcher dialog and, if visible, the startup dialog."""
+    self._close_and_clear_dialog('launcher_dialog')
+    self._close_dialog('startup_dialog')
+
+  def _finalize_dialog(self, attr, delay_ms):
+    """Close the dialog stored in `attr` and drop the reference after `delay_ms`."""
+    QTimer.singleShot(delay_ms, lambda: self._close_and_clear_dialog(attr))
+
+  def _close_and_clear_dialog(self, attr):
+    """Close the dialog stored in `attr` and clear the attribute in one step."""
+    dialog = getattr(self, attr, None)
+    setattr(self, attr, None)
+    if dialog is not None:
+      try:
+        dialog.safe_close()
+      except RuntimeError:
+        # The underlying Qt object is already gone
+        pass
+
+  def _close_dialog(self, attr, visible_only=True):
+    """Close the dialog stored in `attr`; the attribute is cleared once Qt deletes it.
+
+    With visible_only (the default) a hidden dialog is left alone.
+    """
+    dialog = getattr(self, attr, None)
+    if dialog is None or (visible_only and not dialog.isVisible()):
+      return
+    dialog.safe_close()
+    self._clear_dialog_on_destroyed(attr)
+
+  def _clear_dialog_on_destroyed(self, attr):
+    """Clear `attr` once Qt has deleted the dialog it currently holds.
+
+    A dialog stored in `attr` later (e.g. by a new launch) is left alone.
+    """
+    dialog = getattr(self, attr, None)
+    if dialog is None:
+      return
+
+    def clear(*_):
+      if getattr(self, attr, None) is dialog:
+        setattr(self, attr, None)
+    dialog.destroyed.connect(clear)
+
+  def _track_dialog(self, dialog):
+    """Register a dialog so closeEvent can close it without walking the widget tree."""
+    self._open_dialogs.add(dialog)
+    dialog.destroyed.connect(self._prune_open_dialogs)
+    return dialog
+
+  def _prune_open_dialogs(self, *args):
+    """Drop dialogs whose Qt object has been deleted."""
+    for dialog in list(self._open_dialogs):
+      if sip.isdeleted(dialog):
+        self._open_dialogs.discard(dialog)
+
+  def _schedule_ui_refresh(self, tasks):
+    """Queue UI update callables to run together on the next event loop pass."""
+    self._pending_ui_tasks.extend(tasks)
+    if not self._pending_ui_refresh:
+        self._pending_ui_refresh = True
+        QTimer.singleShot(0, self._flush_ui_refresh)
+
+  def _flush_ui_refresh(self):
+    """Run the queued UI updates with painting suspended so they repaint once."""
+    tasks, self._pending_ui_tasks = self._pending_ui_tasks, []
+    self._pending_ui_refresh = False
+    self.setUpdatesEnabled(False)
+    try:
+        for task in tasks:
+            try:
+                task()
+            except Exception as e:
+                self.debug_log("Error during UI refresh: %s", e, color="red")
+    finally:
+        self.setUpdatesEnabled(True)
+
   def _start_container(self):
     """Start the Docker container."""
+    self._last_cleared_for = None
     try:
         # Get the current container name
         container_name = self.docker_handler.container_name
+        self._invalidate_container_state(container_name)
         
         # Get volume name from config or generate one
         volume_name = None
@@ -1162,7 +1508,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         
         # Get node alias from config if available for better user feedback
         node_display_name = container_name
-        container_config = self.config_manager.get_container(container_name)
         if container_config and container_config.node_alias:
             node_display_name = container_config.node_alias
             message = f"Please wait while node '{node_display_name}' is being launched..."
@@ -1170,19 +1515,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             message = "Please wait while Edge Node is being launched..."
             
         # Show loading dialog for launching operation
-        self.launcher_dialog = LoadingDialog(
-            self, 
-            title="Launching Node", 
-            message=message,
-            size=50
-        )
-        self.launcher_dialog.show()
-        
-        # Update message to indicate starting the launch process
-        self.launcher_dialog.update_progress("Preparing to launch Docker container...")
-        
-        # Process events to ensure dialog is visible and responsive
-        QApplication.processEvents()
+        self._show_loading_dialog('launcher_dialog', "Launching Node", message, progress="Preparing to launch Docker container...")
         
         # Start the container launch process
         self._perform_container_launch(container_name, volume_name)
@@ -1192,24 +1525,30 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.loading_indicator.stop()
         
         # Close the launcher dialog if it exists
-        launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-        if launcher_dialog_visible:
-            self.launcher_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
+        self._close_and_clear_dialog('launcher_dialog')
             
         self.add_log(f"Error launching container: {str(e)}", color="red")
         self.toast.show_notification(NotificationType.ERROR, f"Error launching container: {str(e)}")
 
-  def plot_data(self):
-    """Plot container metrics data."""
+  def plot_data(self, dispatch=True):
+    """Plot container metrics data.
+
+    With dispatch=False nothing is requested; the (on_success, on_error)
+    callbacks are returned instead so the caller can fetch the metrics itself.
+    """
     # Skip plotting if Docker pull is in progress to avoid conflicts
     if self.__docker_pull_in_progress:
         self.add_log("Docker pull in progress, skipping plot data", debug=True)
         return
+
+    # Nobody can see the plots while the window is hidden or minimized;
+    # remember the skip so the plots catch up once when it is shown again
+    if self._is_window_hidden():
+        self._plot_skipped_while_hidden = True
+        return
         
     # Get the currently selected container
-    container_name = self.container_combo.currentText()
+    container_name = self._selected_container_name
     if not container_name:
         self.add_log("No container selected, cannot plot data", debug=True)
         return
@@ -1218,47 +1557,68 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     self.docker_handler.set_container_name(container_name)
     
     if not self.is_container_running():
-        self.add_log(f"Container {container_name} is not running, skipping plot data", debug=True)
+        self.debug_log("Container %s is not running, skipping plot data", container_name)
         return
 
     def on_success(history: NodeHistory) -> None:
         # Make sure we're still on the same container
-        current_selected = self.container_combo.currentText()
+        current_selected = self._selected_container_name
         if container_name != current_selected:
-            self.add_log(f"Container changed during data plotting from {container_name} to {current_selected}, ignoring results", debug=True)
+            self.debug_log("Container changed during data plotting from %s to %s, ignoring results", container_name, current_selected)
             return
             
-        self.__last_plot_data = history
-        self.plot_graphs()
+        self._last_plot_data = history
+        # Only repaint the plots when the history actually changed
+        sample_hash = self._history_sample_hash(history)
+        if sample_hash != self.__last_sample_hash:
+            self.__last_sample_hash = sample_hash
+            self.plot_graphs()
+        else:
+            self.debug_log("Metrics unchanged for container %s, skipping redraw", container_name)
         
         # Update uptime and other metrics only for the currently selected container
-        self.__current_node_uptime = history.uptime
-        self.__current_node_epoch = history.current_epoch
-        self.__current_node_epoch_avail = history.current_epoch_avail
-        self.__current_node_ver = history.version
+        self._current_node_uptime = history.uptime
+        self._current_node_epoch = history.current_epoch
+        self._current_node_epoch_avail = history.current_epoch_avail
+        self._current_node_ver = history.version
         
         self.maybe_refresh_uptime()
-        self.add_log(f"Updated metrics for container {container_name}", debug=True)
+        self.debug_log("Updated metrics for container %s", container_name)
 
     def on_error(error):
         # Make sure we're still on the same container
-        if container_name != self.container_combo.currentText():
-            self.add_log(f"Container changed during data plotting, ignoring error", debug=True)
+        if container_name != self._selected_container_name:
+            self.debug_log("Container changed during data plotting, ignoring error")
             return
             
-        self.add_log(f'Error getting metrics for {container_name}: {error}', debug=True)
+        self.debug_log('Error getting metrics for %s: %s', container_name, error)
         
         # If this is a timeout error, log it more prominently
         if "timed out" in error.lower():
             self.add_log(f"Metrics request for {container_name} timed out. This may indicate network issues or high load on the remote host.", color="red")
 
+    if not dispatch:
+        return on_success, on_error
+
     try:
-        self.add_log(f"Plotting data for container: {container_name}", debug=True)
+        self.debug_log("Plotting data for container: %s", container_name)
         self.docker_handler.get_node_history(on_success, on_error)
     except Exception as e:
-        self.add_log(f"Failed to start metrics request for {container_name}: {str(e)}", debug=True, color="red")
+        self.debug_log("Failed to start metrics request for %s: %s", container_name, e, color="red")
         on_error(str(e))
 
+  @staticmethod
+  def _history_sample_hash(history: NodeHistory) -> int:
+    """Cheap fingerprint of a history payload: its length and its first and last timestamps.
+
+    Metric values are left out on purpose: they may be NaN for missing samples,
+    and a new sample or a shifted window always changes the timestamps.
+    """
+    timestamps = history.timestamps
+    if timestamps is None or not len(timestamps):
+      return hash((0, None, None))
+    return hash((len(timestamps), timestamps[0], timestamps[-1]))
+
   def plot_graphs(self, history: Optional[NodeHistory] = None, limit: int = 100) -> None:
     """Plot the graphs with the given history data.
     
@@ -1267,22 +1627,22 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         limit: The maximum number of points to plot.
     """
     # Get the currently selected container
-    container_name = self.container_combo.currentText()
+    container_name = self._selected_container_name
     if not container_name:
         self.add_log("No container selected, cannot plot graphs", debug=True)
         return
      
     # Use provided history or last data
     if history is None:
-       history = self.__last_plot_data
+       history = self._last_plot_data
      
     if history is None:
-        self.add_log(f"No history data available for container {container_name}", debug=True)
+        self.debug_log("No history data available for container %s", container_name)
         return
     
     # Make sure we have timestamps
     if not history.timestamps or len(history.timestamps) == 0:
-        self.add_log(f"No timestamps in history data for container {container_name}", debug=True)
+        self.debug_log("No timestamps in history data for container %s", container_name)
         return
     
     # Clean and limit data
@@ -1290,95 +1650,92 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     if len(timestamps) > limit:
         timestamps = timestamps[-limit:]
      
-    # Get colors based on theme
-    colors = DARK_COLORS if self._current_stylesheet == DARK_STYLESHEET else LIGHT_COLORS
-    
+    # Convert string timestamps to numeric values for plotting (once for all plots and axes)
+    numeric_timestamps = _to_numeric_ts(timestamps)
+    if numeric_timestamps is None:
+        numeric_timestamps = []
+        for ts in timestamps:
+            try:
+                if isinstance(ts, str):
+                    # Convert ISO format string to timestamp
+                    numeric_timestamps.append(datetime.fromisoformat(ts).timestamp())
+                else:
+                    numeric_timestamps.append(float(ts))
+            except (ValueError, TypeError):
+                # If conversion fails, use the index as a fallback
+                self.debug_log("Failed to convert timestamp: %s", ts)
+                numeric_timestamps.append(len(numeric_timestamps))
+        numeric_timestamps = np.asarray(numeric_timestamps, dtype=np.float64)
+
     # Helper function to update a plot
-    def update_plot(plot_widget, timestamps, data, name, color):
+    def update_plot(plot_widget, timestamps, data, name, color_key):
         plot_widget.clear()
-        if data and len(data) > 0:
-            # Ensure data length matches timestamps
-            if len(data) > len(timestamps):
-                data = data[-len(timestamps):]
-            elif len(data) < len(timestamps):
-                # Pad with zeros if needed
-                data = [0] * (len(timestamps) - len(data)) + data
-            
-            # Convert string timestamps to numeric values for plotting
-            numeric_timestamps = []
-            for ts in timestamps:
-                try:
-                    if isinstance(ts, str):
-                        # Convert ISO format string to timestamp
-                        numeric_timestamps.append(datetime.fromisoformat(ts).timestamp())
-                    else:
-                        numeric_timestamps.append(float(ts))
-                except (ValueError, TypeError):
-                    # If conversion fails, use the index as a fallback
-                    self.add_log(f"Failed to convert timestamp: {ts}", debug=True)
-                    numeric_timestamps.append(len(numeric_timestamps))
-            
-            # Plot with numeric timestamps
-            plot_widget.plot(numeric_timestamps, data, pen=color, name=name)
-    
+        if data is not None and len(data) > 0:
+            # Ensure data length matches timestamps, left-padding with zeros if needed
+            size = len(timestamps)
+            values = np.asarray(data[-size:], dtype=np.float64)
+            if len(values) < size:
+                values = np.concatenate((np.zeros(size - len(values)), values))
+            plot_widget.plot(numeric_timestamps, values, pen=self._pens[color_key], name=name)
+    
+    # Helper function to refresh the persistent date axis of a plot
+    def update_axis(key):
+        axis = self._date_axes[key]
+        axis.setTimestamps(numeric_timestamps, parent=key)
+        if not axis.labelText:
+            # The label is blanked when the info display is cleared
+            axis.setLabel(text='Time')
+
+    self._plots_blank = False
+
     # CPU Plot
-    cpu_date_axis = DateAxisItem(orientation='bottom')
-    cpu_date_axis.setTimestamps(timestamps, parent="cpu")
-    self.cpu_plot.getAxis('bottom').setTickSpacing(60, 10)
-    self.cpu_plot.getAxis('bottom').setStyle(tickTextOffset=10)
-    self.cpu_plot.setAxisItems({'bottom': cpu_date_axis})
-    self.cpu_plot.setTitle(CPU_LOAD_TITLE)
-    update_plot(self.cpu_plot, timestamps, history.cpu_load, 'CPU Load', colors["graph_cpu_color"])
+    update_axis("cpu")
+    self._set_plot_title('cpu_plot', CPU_LOAD_TITLE)
+    update_plot(self.cpu_plot, timestamps, history.cpu_load, 'CPU Load', 'graph_cpu_color')
     
     # Memory Plot
-    mem_date_axis = DateAxisItem(orientation='bottom')
-    mem_date_axis.setTimestamps(timestamps, parent="mem")
-    self.memory_plot.getAxis('bottom').setTickSpacing(60, 10)
-    self.memory_plot.getAxis('bottom').setStyle(tickTextOffset=10)
-    self.memory_plot.setAxisItems({'bottom': mem_date_axis})
-    self.memory_plot.setTitle(MEMORY_USAGE_TITLE)
-    update_plot(self.memory_plot, timestamps, history.occupied_memory, 'Occupied Memory', colors["graph_memory_color"])
+    update_axis("mem")
+    self._set_plot_title('memory_plot', MEMORY_USAGE_TITLE)
+    update_plot(self.memory_plot, timestamps, history.occupied_memory, 'Occupied Memory', 'graph_memory_color')
     
     # GPU Plot if available
-    if history and history.gpu_load:
-      gpu_date_axis = DateAxisItem(orientation='bottom')
-      gpu_date_axis.setTimestamps(timestamps, parent="gpu")
-      self.gpu_plot.getAxis('bottom').setTickSpacing(60, 10)
-      self.gpu_plot.getAxis('bottom').setStyle(tickTextOffset=10)
-      self.gpu_plot.setAxisItems({'bottom': gpu_date_axis})
-      self.gpu_plot.setTitle(GPU_LOAD_TITLE)
-      update_plot(self.gpu_plot, timestamps, history.gpu_load, 'GPU Load', colors["graph_gpu_color"])
+    if history and history.gpu_load is not None and len(history.gpu_load):
+      update_axis("gpu")
+      self._set_plot_title('gpu_plot', GPU_LOAD_TITLE)
+      update_plot(self.gpu_plot, timestamps, history.gpu_load, 'GPU Load', 'graph_gpu_color')
 
     # GPU Memory if available
-    if history and history.gpu_occupied_memory:
-      gpumem_date_axis = DateAxisItem(orientation='bottom')
-      gpumem_date_axis.setTimestamps(timestamps, parent="gpu_mem")
-      self.gpu_memory_plot.getAxis('bottom').setTickSpacing(60, 10)
-      self.gpu_memory_plot.getAxis('bottom').setStyle(tickTextOffset=10)
-      self.gpu_memory_plot.setAxisItems({'bottom': gpumem_date_axis})
-      self.gpu_memory_plot.setTitle(GPU_MEMORY_LOAD_TITLE)
-      update_plot(self.gpu_memory_plot, timestamps, history.gpu_occupied_memory, 'Occupied GPU Memory', colors["graph_gpu_memory_color"])
+    if history and history.gpu_occupied_memory is not None and len(history.gpu_occupied_memory):
+      update_axis("gpu_mem")
+      self._set_plot_title('gpu_memory_plot', GPU_MEMORY_LOAD_TITLE)
+      update_plot(self.gpu_memory_plot, timestamps, history.gpu_occupied_memory, 'Occupied GPU Memory', 'graph_gpu_memory_color')
       
-    self.add_log(f"Updated graphs for container {container_name} with {len(timestamps)} data points", debug=True)
+    self.debug_log("Updated graphs for container %s with %s data points", container_name, len(timestamps))
+
+  def _set_plot_title(self, plot_name, title):
+    """Set a plot title, skipping the pyqtgraph call when it is already shown."""
+    if self._plot_labels_state.get(plot_name) != title:
+        getattr(self, plot_name).setTitle(title)
+        self._plot_labels_state[plot_name] = title
 
   def update_plot(plot_widget, timestamps, data, name, color):
     """Update a plot with the given data."""
     plot_widget.setTitle(name)
 
-  def refresh_node_info(self):
-    """Refresh the node information by fetching fresh data from the container and updating the UI."""
+  def refresh_node_info(self, dispatch=True):
+    """Refresh the node information by fetching fresh data from the container and updating the UI.
+
+    With dispatch=False nothing is requested; the (on_success, on_error)
+    callbacks are returned instead so the caller can fetch the node info itself.
+    """
+    self._last_cleared_for = None
     # Skip refresh if Docker pull is in progress to avoid conflicts
     if self.__docker_pull_in_progress:
         self.add_log("Docker pull in progress, skipping node info refresh", debug=True)
         return
         
     # Get the current container
-    current_index = self.container_combo.currentIndex() 
-    if current_index < 0:
-      self._update_ui_no_container()
-      return
-
-    container_name = self.container_combo.itemData(current_index)
+    container_name = self._selected_container_name
     if not container_name:
       self._update_ui_no_container()
       return
@@ -1388,16 +1745,18 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
     # Check if container is running - if not, show cached data or appropriate messages
     if not self.is_container_running():
-      self._update_ui_container_not_running(container_name)
+      self._update_ui_container_not_running(
+        container_name, self.config_manager.get_container(container_name)
+      )
       return
 
     # Container is running - get fresh node info
-    self.add_log(f"Getting node information for {container_name}", debug=True)
+    self.debug_log("Getting node information for %s", container_name)
     
     def on_success(node_info: NodeInfo) -> None:
       # Reset failure counter on successful request
       if self.node_info_failure_count > 0:
-        self.add_log(f"Node info request succeeded after {self.node_info_failure_count} failures, resetting counter", debug=True)
+        self.debug_log("Node info request succeeded after %s failures, resetting counter", self.node_info_failure_count)
         self.node_info_failure_count = 0
       
       # Update UI with fresh node info data
@@ -1417,8 +1776,47 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       # Handle error by falling back to cached data or showing error messages
       self._handle_node_info_error(error, container_name)
 
+    if not dispatch:
+      return on_success, on_error
+
     # Get node info from the container
-    self.docker_handler.get_node_info(on_success, on_error)
+    self._request_node_info(on_success, on_error)
+
+  def _request_node_info(self, on_success, on_error, fetch=None):
+    """Request node info, joining an identical request that is still in flight.
+
+    Callers asking for the same container while a request is pending are
+    queued and receive the result of that request instead of issuing a new
+    docker exec. fetch(success_cb, error_cb) issues the request and defaults
+    to docker_handler.get_node_info. Returns True when a new request was issued.
+    """
+    container_name = self.docker_handler.container_name
+    inflight = self._node_info_inflight
+    if (inflight is not None and inflight[0] == container_name
+        and monotonic() - inflight[1] < NODE_INFO_INFLIGHT_TIMEOUT):
+      inflight[2].append((on_success, on_error))
+      self.debug_log("Joining in-flight node info request for %s", container_name)
+      return False
+
+    waiters = [(on_success, on_error)]
+    self._node_info_inflight = (container_name, monotonic(), waiters)
+
+    def release():
+      if self._node_info_inflight is not None and self._node_info_inflight[2] is waiters:
+        self._node_info_inflight = None
+
+    def fan_out_success(node_info):
+      release()
+      for success_cb, _ in waiters:
+        success_cb(node_info)
+
+    def fan_out_error(error):
+      release()
+      for _, error_cb in waiters:
+        error_cb(error)
+
+    (fetch or self.docker_handler.get_node_info)(fan_out_success, fan_out_error)
+    return True
 
   def _restart_container_after_failures(self, container_name: str):
     """Restart container after consecutive get_node_info failures.
@@ -1445,7 +1843,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         volume_name = container_config.volume
         self.add_log(f"Using volume {volume_name} for restart", debug=True)
       else:
-        from utils.docker_utils import get_volume_name
         volume_name = get_volume_name(container_name)
         self.add_log(f"Generated volume name {volume_name} for restart", debug=True)
       
@@ -1474,6 +1871,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       
       def on_stop_success(result):
         stdout, stderr, return_code = result
+        self._invalidate_container_state(container_name)
         if return_code == 0:
           self.add_log(f"Container {container_name} stopped, now pulling latest image", debug=True)
           # Pull the latest image before restarting
@@ -1521,7 +1919,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       
       def on_pull_output(line):
         # Log pull progress for debugging
-        self.add_log(f"Pull: {line.strip()}", debug=True)
+        self.debug_log("Pull: %s", line.strip())
       
       # Pull the latest image
       self.add_log(f"Pulling latest Docker image for restart of {container_name}", color="blue")
@@ -1542,6 +1940,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     try:
       def on_launch_success(result):
         stdout, stderr, return_code = result
+        self._invalidate_container_state(container_name)
         if return_code == 0:
           self.add_log(f"Container {container_name} launched successfully during restart", debug=True)
           on_success()
@@ -1559,6 +1958,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
   def _update_ui_no_container(self):
     """Update UI when no container is selected."""
+    self._last_cleared_for = None
     if not hasattr(self, 'node_addr') or not self.node_addr:
       self.addressDisplay.setText('Address: No container selected')
       self.ethAddressDisplay.setText('ETH Address: Not available')
@@ -1566,13 +1966,14 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       self.copyAddrButton.hide()
       self.copyEthButton.hide()
 
-  def _update_ui_container_not_running(self, container_name: str):
+  def _update_ui_container_not_running(self, container_name: str, config_container=None):
     """Update UI when container is not running - show cached data or appropriate messages."""
     # Check if we're in a loading state (container starting up)
-    is_loading = hasattr(self, 'loading_indicator') and self.loading_indicator.isVisible()
+    is_loading = self.loading_indicator is not None and self.loading_indicator.isVisible()
     
-    # Try to get cached data from config
-    config_container = self.config_manager.get_container(container_name)
+    # Try to get cached data from config unless the caller already looked it up
+    if config_container is None:
+      config_container = self.config_manager.get_container(container_name)
     
     if config_container and config_container.node_address:
       # Use cached data if available
@@ -1584,11 +1985,12 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       self._update_address_display(self.node_addr, show_copy_button=True)
       self._update_eth_address_display(self.node_eth_address, show_copy_button=True)
       if self.node_name:
-        self.nameDisplay.setText('Name: ' + self.node_name)
+        self._update_name_display(self.node_name)
       
-      self.add_log(f"Showing cached data for stopped container: {container_name}", debug=True)
+      self.debug_log("Showing cached data for stopped container: %s", container_name)
     else:
       # No cached data available
+      self._last_cleared_for = None
       if is_loading:
         # Container is starting up - show loading messages
         self.addressDisplay.setText('Address: Starting up...')
@@ -1603,23 +2005,34 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       self.copyAddrButton.hide()
       self.copyEthButton.hide()
 
-  def _update_ui_with_fresh_data(self, node_info: NodeInfo, container_name: str):
+  def _update_ui_with_fresh_data(self, node_info: NodeInfo, container_name: str, config_container=None):
     """Update UI with fresh node info data."""
-    # Get current config to check for changes
-    config_container = self.config_manager.get_container(container_name)
+    # Get current config to check for changes unless the caller already looked it up
+    if config_container is None:
+      config_container = self.config_manager.get_container(container_name)
     
-    # Check if node alias has changed and update config
-    if config_container and node_info.alias != config_container.node_alias:
-        self.add_log(f"Node alias changed from '{config_container.node_alias}' to '{node_info.alias}', updating config", debug=True)
-        self.config_manager.update_node_alias(container_name, node_info.alias)
+    alias_changed = bool(config_container) and node_info.alias != config_container.node_alias
+    if alias_changed:
+        self.debug_log("Node alias changed from '%s' to '%s', updating config", config_container.node_alias, node_info.alias)
+
+    # Save fresh data to config in a single write (skipped if nothing changed)
+    if container_name:
+      self.config_manager.update_container_fields(
+        container_name,
+        node_address=node_info.address,
+        eth_address=node_info.eth_address,
+        node_alias=node_info.alias if alias_changed else None,
+      )
+      self.debug_log("Saved fresh node address and ETH address to config for %s", container_name)
+
+    if alias_changed:
         # Refresh container list to update display in dropdown
         current_container = container_name  # Store current selection
         self.refresh_container_list()
         # Restore the selection
-        for i in range(self.container_combo.count()):
-            if self.container_combo.itemData(i) == current_container:
-                self.container_combo.setCurrentIndex(i)
-                break
+        idx = self._combo_index_by_name.get(current_container)
+        if idx is not None:
+            self.container_combo.setCurrentIndex(idx)
 
     # Update instance variables with fresh data
     self.node_addr = node_info.address
@@ -1629,24 +2042,19 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     # Update UI displays
     self._update_address_display(self.node_addr, show_copy_button=True)
     self._update_eth_address_display(self.node_eth_address, show_copy_button=True)
-    self.nameDisplay.setText('Name: ' + node_info.alias)
-
-    # Save fresh data to config
-    if container_name:
-      self.config_manager.update_node_address(container_name, self.node_addr)
-      self.config_manager.update_eth_address(container_name, self.node_eth_address)
-      self.add_log(f"Saved fresh node address and ETH address to config for {container_name}", debug=True)
+    self._update_name_display(node_info.alias)
 
     self.add_log(f'Node info updated with fresh data for {container_name}: {self.node_addr} : {self.node_name}, ETH: {self.node_eth_address}')
 
-  def _handle_node_info_error(self, error: str, container_name: str):
+  def _handle_node_info_error(self, error: str, container_name: str, config_container=None):
     """Handle errors when fetching node info by falling back to cached data or showing error messages."""
-    # Try to fall back to cached data first
-    config_container = self.config_manager.get_container(container_name)
+    # Try to fall back to cached data first unless the caller already looked it up
+    if config_container is None:
+      config_container = self.config_manager.get_container(container_name)
     
     if config_container and config_container.node_address and hasattr(self, 'node_addr') and self.node_addr:
       # We have both cached data and current data - just log the error but keep current display
-      self.add_log(f'Error getting fresh node info for {container_name}: {error}', debug=True)
+      self.debug_log('Error getting fresh node info for %s: %s', container_name, error)
       
       if "timed out" in error.lower():
         self.add_log(
@@ -1654,9 +2062,10 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
           color="yellow")
     else:
       # No cached data or current data - show appropriate error messages
-      is_loading = hasattr(self, 'loading_indicator') and self.loading_indicator.isVisible()
+      is_loading = self.loading_indicator is not None and self.loading_indicator.isVisible()
+      self._last_cleared_for = None
       
-      self.add_log(f'Error getting node info for {container_name}: {error}', debug=True)
+      self.debug_log('Error getting node info for %s: %s', container_name, error)
       
       if is_loading:
         # Container is starting up - show loading messages instead of error
@@ -1677,31 +2086,56 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
           f"Node info request for {container_name} timed out. This may indicate network issues or high load.",
           color="red")
 
+  @staticmethod
+  def _set_label_text(label, text):
+    """Set `text` on `label` only if it differs from what is displayed."""
+    if label.text() != text:
+      label.setText(text)
+
+  @staticmethod
+  def _set_widget_visible(widget, visible):
+    """Show or hide `widget` only if its explicit visibility changes."""
+    if widget.isHidden() == visible:
+      widget.setVisible(visible)
+
+  def _update_name_display(self, name: str):
+    """Helper method to show the node name, skipping the update if unchanged."""
+    self._last_cleared_for = None
+    self._set_label_text(self.nameDisplay, 'Name: ' + name)
+
+  def _apply_container_data_to_ui(self, cfg: ContainerConfig) -> None:
+    """Show the node data saved in a container config; missing fields keep their labels."""
+    self.node_addr = cfg.node_address
+    self.node_eth_address = cfg.eth_address
+    self.node_name = cfg.node_alias
+    if cfg.node_address:
+      self._set_label_text(self.addressDisplay, cfg.display_node_addr)
+      self._set_widget_visible(self.copyAddrButton, True)
+    if cfg.eth_address:
+      self._set_label_text(self.ethAddressDisplay, cfg.display_eth_addr)
+      self._set_widget_visible(self.copyEthButton, True)
+    if cfg.node_alias:
+      self._update_name_display(cfg.node_alias)
+
   def _update_address_display(self, address: str, show_copy_button: bool = False):
     """Helper method to update address display with consistent formatting."""
+    self._last_cleared_for = None
     if address:
-      if len(address) > 24:  # Only truncate if long enough
-        str_display = f"Address: {address[:16]}...{address[-8:]}"
-      else:
-        str_display = f"Address: {address}"
-      self.addressDisplay.setText(str_display)
-      self.copyAddrButton.setVisible(show_copy_button)
+      self._set_label_text(self.addressDisplay, format_address_label("Address", address))
+      self._set_widget_visible(self.copyAddrButton, show_copy_button)
     else:
-      self.addressDisplay.setText('Address: -')
-      self.copyAddrButton.hide()
+      self._set_label_text(self.addressDisplay, 'Address: -')
+      self._set_widget_visible(self.copyAddrButton, False)
 
   def _update_eth_address_display(self, eth_address: str, show_copy_button: bool = False):
     """Helper method to update ETH address display with consistent formatting."""
+    self._last_cleared_for = None
     if eth_address:
-      if len(eth_address) > 24:  # Only truncate if long enough
-        str_display = f"ETH Address: {eth_address[:16]}...{eth_address[-8:]}"
-      else:
-        str_display = f"ETH Address: {eth_address}"
-      self.ethAddressDisplay.setText(str_display)
-      self.copyEthButton.setVisible(show_copy_button)
+      self._set_label_text(self.ethAddressDisplay, format_address_label("ETH Address", eth_address))
+      self._set_widget_visible(self.copyEthButton, show_copy_button)
     else:
-      self.ethAddressDisplay.setText('ETH Address: -')
-      self.copyEthButton.hide()
+      self._set_label_text(self.ethAddressDisplay, 'ETH Address: -')
+      self._set_widget_visible(self.copyEthButton, False)
 
   def maybe_refresh_uptime(self):
     """Update uptime, epoch and epoch availability displays.
@@ -1710,98 +2144,90 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     It only updates if the data has changed.
     """
     # Get the currently selected container
-    container_name = self.container_combo.currentText()
+    container_name = self._selected_container_name
     if not container_name:
         self.add_log("No container selected, cannot refresh uptime", debug=True)
         return
     
     # Get current values
-    uptime = self.__current_node_uptime
-    node_epoch = self.__current_node_epoch
-    node_epoch_avail = self.__current_node_epoch_avail
-    ver = self.__current_node_ver
-    color = 'black'
+    uptime = self._current_node_uptime
+    node_epoch = self._current_node_epoch
+    node_epoch_avail = self._current_node_epoch_avail
+    ver = self._current_node_ver
     
     # Check if container is running
     if not self.is_container_running():
       # Check if we're in a loading state (container starting up)
-      is_loading = hasattr(self, 'loading_indicator') and self.loading_indicator.isVisible()
+      is_loading = self.loading_indicator is not None and self.loading_indicator.isVisible()
       
       if is_loading:
         uptime = "STARTING..."
         node_epoch = "Loading..."
         node_epoch_avail = 0
         ver = "Loading..."
-        color = 'blue'
       else:
         uptime = "STOPPED"
         node_epoch = "N/A"
         node_epoch_avail = 0
         ver = "N/A"
-        color = 'red'
       
     # Only update if values have changed
-    if uptime != self.__display_uptime:
-
-      self.node_uptime.setText(f'Up Time: {uptime}')
-
-      self.node_epoch.setText(f'Epoch: {node_epoch}')
-
-      prc = round(node_epoch_avail * 100 if node_epoch_avail > 0 else node_epoch_avail, 2) if node_epoch_avail is not None else 0
-      self.node_epoch_avail.setText(f'Epoch avail: {prc}%')
-
-      self.node_version.setText(f'Running ver: {ver}')
-
-      self.__display_uptime = uptime
-      self.add_log(f"Updated uptime display for container {container_name}", debug=True)
+    if uptime != self._display_uptime:
+      # Repaint the info box once for all four labels, touching only those that changed
+      self._info_labels_blank = False
+      info_box = self.node_uptime.parentWidget()
+      info_box.setUpdatesEnabled(False)
+      try:
+        self._set_label_text(self.node_uptime, f'Up Time: {uptime}')
+        self._set_label_text(self.node_epoch, f'Epoch: {node_epoch}')
+        if node_epoch_avail != self._last_epoch_avail:
+          prc = round(max(node_epoch_avail, 0) * 100, 2) if node_epoch_avail is not None else 0
+          self._set_label_text(self.node_epoch_avail, f'Epoch avail: {prc}%')
+          self._last_epoch_avail = node_epoch_avail
+        self._set_label_text(self.node_version, f'Running ver: {ver}')
+      finally:
+        info_box.setUpdatesEnabled(True)
+
+      self._display_uptime = uptime
+      self.debug_log("Updated uptime display for container %s", container_name)
     return
 
   def copy_address(self):
     """Copy the node address to clipboard for the currently selected container."""
-    # Get the currently selected container
-    container_name = self.container_combo.currentText()
-    if not container_name:
-        self.toast.show_notification(NotificationType.ERROR, "No container selected")
-        return
-    
-    # Check if we have an address
-    if not self.node_addr:
-      # Try to get from config
-      config_container = self.config_manager.get_container(container_name)
-      if config_container and config_container.node_address:
-          self.node_addr = config_container.node_address
-      else:
-          self.toast.show_notification(NotificationType.ERROR, NOTIFICATION_ADDRESS_COPY_FAILED)
-          return
-
-    clipboard = QApplication.clipboard()
-    clipboard.setText(self.node_addr)
-    self.toast.show_notification(NotificationType.SUCCESS, NOTIFICATION_ADDRESS_COPIED.format(address=self.node_addr))
-    self.add_log(f"Copied node address for container {container_name}", debug=True)
-    return
+    self._copy_to_clipboard('node_addr', 'node_address', 'node address')
 
   def copy_eth_address(self):
     """Copy the ETH address to clipboard for the currently selected container."""
+    self._copy_to_clipboard('node_eth_address', 'eth_address', 'ETH address')
+
+  def _copy_to_clipboard(self, value_attr: str, config_attr: str, kind: str):
+    """Copy an address of the selected node to the clipboard.
+
+    Args:
+        value_attr: Attribute of self holding the displayed value
+        config_attr: ContainerConfig attribute used when nothing is displayed yet
+        kind: Human readable name of the value for the log
+    """
     # Get the currently selected container
-    container_name = self.container_combo.currentText()
+    container_name = self._selected_container_name
     if not container_name:
         self.toast.show_notification(NotificationType.ERROR, "No container selected")
         return
     
     # Check if we have an address
-    if not self.node_eth_address:
+    value = getattr(self, value_attr)
+    if not value:
       # Try to get from config
       config_container = self.config_manager.get_container(container_name)
-      if config_container and config_container.eth_address:
-          self.node_eth_address = config_container.eth_address
-      else:
+      value = getattr(config_container, config_attr, None) if config_container else None
+      if not value:
           self.toast.show_notification(NotificationType.ERROR, NOTIFICATION_ADDRESS_COPY_FAILED)
           return
+      setattr(self, value_attr, value)
 
-    clipboard = QApplication.clipboard()
-    clipboard.setText(self.node_eth_address)
-    self.toast.show_notification(NotificationType.SUCCESS, NOTIFICATION_ADDRESS_COPIED.format(address=self.node_eth_address))
-    self.add_log(f"Copied ETH address for container {container_name}", debug=True)
+    self._clipboard.setText(value)
+    self.toast.show_notification(NotificationType.SUCCESS, NOTIFICATION_ADDRESS_COPIED.format(address=value))
+    self.debug_log("Copied %s for container %s", kind, container_name)
     return
 
   def refresh_all(self):
@@ -1811,16 +2237,32 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         return
     self.add_log('Refreshing', debug=True)
 
-    # Only auto-restart if container is not running, button is enabled, user didn't intentionally stop it, AND no pull is in progress
-    if not self.is_container_running() and self.toggleButton.isEnabled() == True and not self.user_stopped_container:
-      self.add_log("Container is supposed to run. Starting it now...", debug=True, color="red")
-      self._start_container()
-      sleep(5)
+    # Inspect the selected container once; every consumer in this tick reads the snapshot
+    container_name = self._selected_container_name
+    if container_name:
+      self._refresh_snapshot = (container_name,) + tuple(self._get_container_state(container_name))
 
-    self._refresh_local_containers()
+    try:
+      # Only auto-restart if container is not running, button is enabled, user didn't intentionally stop it, AND no pull is in progress
+      if self._post_start_polls is not None:
+        self.add_log("Waiting for restarted container, skipping local refresh", debug=True)
+      elif self._rename_restart_inflight:
+        # The stop/relaunch after a rename is still running; don't start a second launch
+        self._refresh_local_containers()
+      elif not self.is_container_running() and self.toggleButton.isEnabled() == True and not self.user_stopped_container:
+        self.add_log("Container is supposed to run. Starting it now...", debug=True, color="red")
+        self._refresh_snapshot = None
+        self._start_container()
+        # Poll for the container from the event loop instead of blocking it
+        self._post_start_polls = list(POST_START_POLL_DELAYS)
+        QTimer.singleShot(self._post_start_polls.pop(0), self._post_start_followup)
+      else:
+        self._refresh_local_containers()
+    finally:
+      self._refresh_snapshot = None
 
     # Update system resources display
-    self.update_resources_display()
+    self._maybe_update_resources()
 
     # Check for updates periodically - but only if no update is already in progress
     if not self.__update_in_progress and (time() - self.__last_auto_update_check) > AUTO_UPDATE_CHECK_INTERVAL:
@@ -1829,6 +2271,21 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       self.check_for_updates(verbose=verbose or FULL_DEBUG)
 
 
+  def _post_start_followup(self):
+    """Refresh the local container info once an auto-restarted container is up.
+
+    Re-checks with growing delays and gives up after POST_START_POLL_DELAYS.
+    """
+    if self._post_start_polls is None:
+      return
+    container_name = self.docker_handler.container_name
+    self._is_running_cache.pop(container_name, None)
+    if not self.is_container_running() and self._post_start_polls:
+      QTimer.singleShot(self._post_start_polls.pop(0), self._post_start_followup)
+      return
+    self._post_start_polls = None
+    self._refresh_local_containers()
+
   def force_refresh_all(self):
     """Force refresh all node information immediately.
     
@@ -1837,12 +2294,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     """
     try:
         # Get the currently selected container
-        current_index = self.container_combo.currentIndex()
-        if current_index < 0:
-            self.toast.show_notification(NotificationType.ERROR, "No container selected")
-            return
-            
-        container_name = self.container_combo.itemData(current_index)
+        container_name = self._selected_container_name
         if not container_name:
             self.toast.show_notification(NotificationType.ERROR, "No container selected")
             return
@@ -1863,68 +2315,66 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             # Still update what we can
             self.update_toggle_button_text()
             self.maybe_refresh_uptime()  # This will show "STOPPED" status
-            self.update_resources_display()
+            self._maybe_update_resources()
             return
         
         # Container is running - get fresh node info directly
         self.add_log("Getting fresh node information from container...", debug=True)
         
-        # Clear current data to force fresh retrieval
-        self.node_addr = None
-        self.node_eth_address = None
-        self.node_name = None
-        self.__display_uptime = None
+        # Keep the last known node data so a failed refresh can fall back to it;
+        # only force the uptime block to be redrawn
+        self._display_uptime = None
+        self._last_epoch_avail = None
         
         # Define success callback for get_node_info
         def on_node_info_success(node_info: NodeInfo) -> None:
             self.add_log(f"Received fresh node info: {node_info.address}, {node_info.alias}, ETH: {node_info.eth_address}", color="green")
             
-            # Update all node information from the fresh response
-            self.node_addr = node_info.address
-            self.node_eth_address = node_info.eth_address
-            self.node_name = node_info.alias
+            # Update node information from the fresh response, keeping known values
+            # when the response is missing them
+            if node_info.address is not None and node_info.address != self.node_addr:
+                self.node_addr = node_info.address
+            if node_info.eth_address is not None and node_info.eth_address != self.node_eth_address:
+                self.node_eth_address = node_info.eth_address
+            if node_info.alias is not None and node_info.alias != self.node_name:
+                self.node_name = node_info.alias
             
-            # Update displays with fresh data
+            # Update displays (unchanged labels are left alone)
             if self.node_addr:
-                if len(self.node_addr) > 24:
-                    str_display = f"Address: {self.node_addr[:16]}...{self.node_addr[-8:]}"
-                else:
-                    str_display = f"Address: {self.node_addr}"
-                self.addressDisplay.setText(str_display)
-                self.copyAddrButton.setVisible(True)
+                self._update_address_display(self.node_addr, show_copy_button=True)
             
             if self.node_eth_address:
-                if len(self.node_eth_address) > 24:
-                    str_eth_display = f"ETH Address: {self.node_eth_address[:16]}...{self.node_eth_address[-8:]}"
-                else:
-                    str_eth_display = f"ETH Address: {self.node_eth_address}"
-                self.ethAddressDisplay.setText(str_eth_display)
-                self.copyEthButton.setVisible(True)
+                self._update_eth_address_display(self.node_eth_address, show_copy_button=True)
             
             if self.node_name:
-                self.nameDisplay.setText('Name: ' + self.node_name)
+                self._update_name_display(self.node_name)
             
-            # Save fresh addresses to config
-            self.config_manager.update_node_address(container_name, self.node_addr)
-            self.config_manager.update_eth_address(container_name, self.node_eth_address)
-            
-            # Check if node alias has changed and update config
+            # Check if node alias has changed
             config_container = self.config_manager.get_container(container_name)
-            if config_container and node_info.alias != config_container.node_alias:
-                self.add_log(f"Node alias changed from '{config_container.node_alias}' to '{node_info.alias}', updating config", debug=True)
-                self.config_manager.update_node_alias(container_name, node_info.alias)
+            alias_changed = bool(config_container) and node_info.alias != config_container.node_alias
+            if alias_changed:
+                self.debug_log("Node alias changed from '%s' to '%s', updating config", config_container.node_alias, node_info.alias)
+            
+            # Save fresh addresses (and the new alias) to config in a single write
+            self.config_manager.update_container_fields(
+                container_name,
+                node_address=self.node_addr,
+                eth_address=self.node_eth_address,
+                node_alias=node_info.alias if alias_changed else None,
+            )
+            
+            if alias_changed:
                 # Refresh container list to update display in dropdown
                 current_container = container_name
                 self.refresh_container_list()
                 # Restore the selection
-                for i in range(self.container_combo.count()):
-                    if self.container_combo.itemData(i) == current_container:
-                        self.container_combo.setCurrentIndex(i)
-                        break
+                idx = self._combo_index_by_name.get(current_container)
+                if idx is not None:
+                    self.container_combo.setCurrentIndex(idx)
             
             # Now refresh metrics and other data
             self.add_log("Refreshing node metrics and performance data...", debug=True)
-            self.plot_data()
+            self._maybe_plot_data()
             
             # Force refresh uptime, epoch, and version info
             self.add_log("Refreshing node status information...", debug=True)
@@ -1932,7 +2382,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             
             # Update system resources
             self.add_log("Refreshing system resources...", debug=True)
-            self.update_resources_display()
+            self._maybe_update_resources()
             
             # Update button states
             self.update_toggle_button_text()
@@ -1952,13 +2402,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             
             # Still try to refresh other data
             self.add_log("Attempting to refresh other data despite node info error...", debug=True)
-            self.plot_data()
+            self._maybe_plot_data()
             self.maybe_refresh_uptime()
-            self.update_resources_display()
+            self._maybe_update_resources()
             self.update_toggle_button_text()
         
-        # Call get_node_info to get fresh data
-        self.docker_handler.get_node_info(on_node_info_success, on_node_info_error)
+        # Call get_node_info to get fresh data (joins a request already in flight)
+        self._request_node_info(on_node_info_success, on_node_info_error)
         
     except Exception as e:
         error_msg = f"Error during force refresh: {str(e)}"
@@ -1970,14 +2420,15 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     """Refresh local container list and info."""
     try:
         # Stop any stale loading indicator during regular refresh
-        if hasattr(self, 'loading_indicator') and not self.is_container_running():
+        if self.loading_indicator is not None and not self.is_container_running():
             self.loading_indicator.stop()
         
-        # Clear any remote connection settings to ensure we're using local Docker
-        if hasattr(self, 'docker_handler'):
+        # Clear any remote connection settings to ensure we're using local Docker,
+        # only touching them when something is actually configured
+        # (docker_handler and ssh_service are always set up before the first refresh)
+        if self.docker_handler.remote_ssh_command is not None:
             self.docker_handler.remote_ssh_command = None
-        
-        if hasattr(self, 'ssh_service'):
+        if self.ssh_service.config is not None or self.ssh_service.ssh_command:
             self.ssh_service.clear_configuration()
         
         # We don't need to refresh the container list on every refresh
@@ -1987,14 +2438,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         # Update container info if running
         if self.is_container_running():
             try:
-                # Refresh address first (usually faster)
-                self.refresh_node_info()
-                
-                # Then plot data (can be slower)
-                try:
-                    self.plot_data()
-                except Exception as e:
-                    self.add_log(f"Error plotting data for local container: {str(e)}", debug=True, color="red")
+                self._refresh_node_info_and_plot()
             except Exception as e:
                 self.add_log(f"Error refreshing local container info: {str(e)}", color="red")
         else:
@@ -2009,7 +2453,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.update_toggle_button_text()
 
   def dapp_button_clicked(self):
-    import webbrowser
     dapp_url = DAPP_URLS.get(self.current_environment)
     if dapp_url:
       webbrowser.open(dapp_url)
@@ -2033,24 +2476,14 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
   
   def update_toggle_button_text(self):
     """Update the toggle button text and style based on the current container state"""
-    # Get the current index from the combo box
-    current_index = self.container_combo.currentIndex()
-    
     # Get the current text to check if it needs to be updated
     current_text = self.toggleButton.text()
     current_enabled = self.toggleButton.isEnabled()
     
-    if current_index < 0:
-        # Only update if state changed
-        if current_text != LAUNCH_CONTAINER_BUTTON_TEXT or current_enabled:
-            self.toggleButton.setText(LAUNCH_CONTAINER_BUTTON_TEXT)
-            self.apply_button_style(self.toggleButton, 'toggle_disabled')
-            self.toggleButton.setEnabled(False)
-        return
-        
-    # Get the actual container name from the item data
-    container_name = self.container_combo.itemData(current_index)
+    # Get the actual container name of the current selection
+    container_name = self._selected_container_name
     if not container_name:
+        self._toggle_state_cache = None
         # Only update if state changed
         if current_text != LAUNCH_CONTAINER_BUTTON_TEXT or current_enabled:
             self.toggleButton.setText(LAUNCH_CONTAINER_BUTTON_TEXT)
@@ -2058,13 +2491,16 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             self.toggleButton.setEnabled(False)
         return
     
-    # Check if container exists in Docker
-    container_exists = self.container_exists_in_docker(container_name)
+    # Make sure the docker handler has the correct container name
+    self.docker_handler.set_container_name(container_name)
+
+    container_exists, is_running = self._get_container_state(container_name)
     
     # If container doesn't exist in Docker but exists in config, show launch button
     if not container_exists:
         config_container = self.config_manager.get_container(container_name)
         if config_container:
+            self._toggle_state_cache = None
             # Only update if state changed
             if current_text != LAUNCH_CONTAINER_BUTTON_TEXT or not current_enabled:
                 self.toggleButton.setText(LAUNCH_CONTAINER_BUTTON_TEXT)
@@ -2072,23 +2508,24 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                 self.toggleButton.setEnabled(True)
             return
     
-    # Make sure the docker handler has the correct container name
-    self.docker_handler.set_container_name(container_name)
-    
-    # Check if the container is running using docker_handler directly
-    is_running = self.docker_handler.is_container_running()
-    
     # Determine the new state
     new_text = STOP_CONTAINER_BUTTON_TEXT if is_running else LAUNCH_CONTAINER_BUTTON_TEXT
     new_style = 'toggle_stop' if is_running else 'toggle_start'
+
+    # Nothing to do if this exact state was already applied in the current theme
+    # and nobody changed the button since
+    state = (container_name, is_running, self._theme_key)
+    if state == self._toggle_state_cache and current_text == new_text and current_enabled:
+        return
     
     # Update text if changed
     if current_text != new_text:
         self.toggleButton.setText(new_text)
     
-    # Always apply the style to ensure it updates when theme changes
+    # Apply the style so it follows theme changes
     self.apply_button_style(self.toggleButton, new_style)
     self.toggleButton.setEnabled(True)
+    self._toggle_state_cache = state
   
   
   def toggle_force_debug(self, state):
@@ -2097,10 +2534,9 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     Args:
         state: The state of the checkbox (Qt.Checked or Qt.Unchecked)
     """
-    from PyQt5.QtCore import Qt
-    
     is_checked = state == Qt.Checked
     self.__force_debug = is_checked
+    self._refresh_debug_enabled()
     
     # Save the debug state
     self.config_manager.set_force_debug(is_checked)
@@ -2123,13 +2559,8 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.add_log("Note: You may need to restart the container for debug mode changes to take effect", color="yellow")
 
   def show_rename_dialog(self):
-    # Get the current index and container name from the data
-    current_index = self.container_combo.currentIndex()
-    if current_index < 0:
-        self.toast.show_notification(NotificationType.ERROR, "No container selected")
-        return
-        
-    container_name = self.container_combo.itemData(current_index)
+    # Get the container name of the current selection
+    container_name = self._selected_container_name
     if not container_name:
         self.toast.show_notification(NotificationType.ERROR, "No container selected")
         return
@@ -2143,8 +2574,25 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     container_config = self.config_manager.get_container(container_name)
     current_alias = container_config.node_alias if container_config and container_config.node_alias else ""
     
-    # Create dialog
+    # Build the dialog once and reuse it for later renames
+    if self._rename_dialog is None:
+      self._build_rename_dialog()
+    self._rename_container_name = container_name
+    self._rename_input.setText(current_alias)
+
+    # Apply theme-appropriate styles only when the theme changed since last time
+    if self._rename_dialog_theme != self._is_dark:
+      text_color = "white" if self._is_dark else "black"
+      self._rename_input.setStyleSheet(f"color: {text_color};")
+      self._rename_dialog_theme = self._is_dark
+
+    self._rename_input.setFocus()
+    self._rename_dialog.exec_()
+
+  def _build_rename_dialog(self):
+    """Create the rename dialog widgets used by show_rename_dialog."""
     dialog = QDialog(self)
+    self._track_dialog(dialog)
     dialog.setWindowTitle("Change Node Name")
     dialog.setMinimumWidth(450)
     
@@ -2156,13 +2604,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     
     # Add input field
     name_input = QLineEdit()
-    name_input.setText(current_alias)
     name_input.setPlaceholderText("Enter node name")
-    
-    # Apply theme-appropriate styles
-    is_dark = self._current_stylesheet == DARK_STYLESHEET
-    text_color = "white" if is_dark else "black"
-    name_input.setStyleSheet(f"color: {text_color};")
     layout.addWidget(name_input)
     
     # Add restrictions section
@@ -2187,13 +2629,16 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     layout.addLayout(button_layout)
     
     dialog.setLayout(layout)
-    dialog.setStyleSheet(self._current_stylesheet)  # Apply current theme
     
-    # Connect buttons
-    save_btn.clicked.connect(lambda: self.validate_and_save_node_name(name_input.text(), dialog, container_name))
+    # Connect buttons once; the target container is read when Save is clicked
+    save_btn.clicked.connect(
+      lambda: self.validate_and_save_node_name(name_input.text(), dialog, self._rename_container_name)
+    )
     cancel_btn.clicked.connect(dialog.reject)
-    
-    dialog.exec_()
+
+    self._rename_dialog = dialog
+    self._rename_input = name_input
+    self._rename_dialog_theme = None
 
   def validate_and_save_node_name(self, new_name: str, dialog: QDialog, container_name: str = None):
     """Validate and save a new node name.
@@ -2208,11 +2653,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     
     # If container_name not provided, get from current selection
     if not container_name:
-        current_index = self.container_combo.currentIndex()
-        if current_index < 0:
-            self.toast.show_notification(NotificationType.ERROR, "No container selected")
-            return
-        container_name = self.container_combo.itemData(current_index)
+        container_name = self._selected_container_name
         if not container_name:
             self.toast.show_notification(NotificationType.ERROR, "No container selected")
             return
@@ -2242,27 +2683,21 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                 current_container = container_name  # Store current selection
                 self.refresh_container_list()
                 # Restore the selection
-                for i in range(self.container_combo.count()):
-                    if self.container_combo.itemData(i) == current_container:
-                        self.container_combo.setCurrentIndex(i)
-                        break
+                idx = self._combo_index_by_name.get(current_container)
+                if idx is not None:
+                    self.container_combo.setCurrentIndex(idx)
+            
+            # Restart only once the new alias has been read back
+            self._perform_post_rename_restart()
         
         def on_node_info_error(error):
             self.add_log(f"Error getting node info after rename: {error}", debug=True)
             # Still proceed with restart even if we couldn't get the node info
-            self.stop_container()
-            self.launch_container()
-            self.post_launch_setup()
-            self.refresh_node_info()
+            self._perform_post_rename_restart()
         
-        # Get node info to update config with actual container name
+        # Get node info to update config with actual container name. This must be a
+        # new request: one issued before the rename would still carry the old alias
         self.docker_handler.get_node_info(update_config_with_container_name, on_node_info_error)
-        
-        # Stop and restart the container
-        self.stop_container()
-        self.launch_container()
-        self.post_launch_setup()
-        self.refresh_node_info()
 
     def on_error(error: str) -> None:
         self.add_log(f'Error renaming node: {error}', debug=True)
@@ -2275,6 +2710,47 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
     self.docker_handler.update_node_name(new_name, on_success, on_error)
 
+  def _perform_post_rename_restart(self):
+    """Restart the renamed node; ignored while a post-rename restart is already running.
+
+    Stop and relaunch are chained through their completion callbacks, and the
+    in-flight flag is only cleared once the relaunch has succeeded or failed.
+    """
+    if self._rename_restart_inflight:
+      return
+    container_name = self.docker_handler.container_name
+    container_config = self.config_manager.get_container(container_name)
+    if container_config and container_config.volume:
+      volume_name = container_config.volume
+    else:
+      volume_name = get_volume_name(container_name)
+
+    def on_restart_success():
+      self._rename_restart_inflight = False
+      self.post_launch_setup()
+      self.refresh_node_info()
+
+    def on_restart_error(error_msg):
+      self._rename_restart_inflight = False
+      self.add_log(f"Failed to restart {container_name} after rename: {error_msg}", color="red")
+      self.toast.show_notification(NotificationType.ERROR, f"Failed to restart node after rename: {error_msg}")
+      self.update_toggle_button_text()
+
+    def on_stop_success(result):
+      stdout, stderr, return_code = result
+      self._invalidate_container_state(container_name)
+      if return_code != 0:
+        on_restart_error(f"Failed to stop container: {stderr}")
+        return
+      self._restart_launch_container(container_name, volume_name, on_restart_success, on_restart_error)
+
+    def on_stop_error(error_msg):
+      on_restart_error(f"Failed to stop container: {error_msg}")
+
+    self._rename_restart_inflight = True
+    self.add_log(f"Restarting {container_name} to apply the new name", debug=True)
+    self.docker_handler.stop_container_threaded(container_name, on_stop_success, on_stop_error)
+
   def _validate_node_alias(self, alias: str) -> str:
     """Validate a node alias according to the rules.
     
@@ -2284,8 +2760,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     Returns:
         str: Error message if validation fails, empty string if valid
     """
-    import re
-    
     # Check if empty
     if not alias:
         return "Node name cannot be empty"
@@ -2295,7 +2769,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         return f"Node name cannot exceed {MAX_ALIAS_LENGTH} characters (current: {len(alias)})"
     
     # Check allowed characters: letters, numbers, hyphens, underscores
-    if not re.match(r'^[a-zA-Z0-9_-]+$', alias):
+    if not _ALIAS_RE.match(alias):
         return "Node name can only contain letters (a-z, A-Z), numbers (0-9), hyphens (-), and underscores (_)"
     
     return ""  # Valid
@@ -2312,53 +2786,59 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     error_lower = error.lower()
     
     # Check for common error patterns and provide specific messages
-    if "timeout" in error_lower or "timed out" in error_lower:
-        return "Operation timed out. Please check your connection and try again."
-    elif "connection" in error_lower and ("refused" in error_lower or "failed" in error_lower):
-        return "Unable to connect to the node. Please ensure the container is running."
-    elif "permission" in error_lower or "forbidden" in error_lower:
-        return "Permission denied. Please check your node permissions."
-    elif "invalid" in error_lower and "name" in error_lower:
-        return "The provided name is invalid or not accepted by the node."
-    elif "conflict" in error_lower or "already exists" in error_lower:
-        return "A node with this name already exists. Please choose a different name."
-    elif "network" in error_lower:
-        return "Network error occurred. Please check your connection and try again."
-    elif "not found" in error_lower or "404" in error:
-        return "Node endpoint not found. The container may not be fully started."
-    elif "bad request" in error_lower or "400" in error:
-        return "Invalid request. Please check the node name format."
-    elif "internal server error" in error_lower or "500" in error:
-        return "Internal server error occurred. Please try again later."
-    else:
-        # Return a cleaned up version of the original error
-        # Remove common technical prefixes and clean up the message
-        cleaned_error = error.strip()
-        if cleaned_error.startswith("Error:"):
-            cleaned_error = cleaned_error[6:].strip()
-        if cleaned_error.startswith("Failed to"):
-            cleaned_error = cleaned_error[9:].strip()
-        
-        # Capitalize first letter if it's not already
-        if cleaned_error and cleaned_error[0].islower():
-            cleaned_error = cleaned_error[0].upper() + cleaned_error[1:]
-        
-        return cleaned_error if cleaned_error else "Unknown error occurred"
+    for groups, message in _RENAME_ERROR_PATTERNS:
+        if all(any(needle in error_lower for needle in group) for group in groups):
+            return message
+
+    # Return a cleaned up version of the original error
+    # Remove common technical prefixes and clean up the message
+    cleaned_error = _ERR_PREFIX_RE.sub('', error.strip(), count=1).strip()
+    
+    # Capitalize first letter if it's not already
+    cleaned_error = cleaned_error[:1].upper() + cleaned_error[1:]
+    
+    return cleaned_error if cleaned_error else "Unknown error occurred"
+
+  @contextmanager
+  def batch_ui_updates(self):
+    """Hold back repaints of the window until the outermost batch exits.
+
+    Batches nest; only the outermost one disables and re-enables updates,
+    so Qt coalesces all widget changes made inside into a single repaint.
+    """
+    self._batch_depth += 1
+    if self._batch_depth == 1:
+      self.setUpdatesEnabled(False)
+    try:
+      yield
+    finally:
+      self._batch_depth -= 1
+      if self._batch_depth == 0:
+        self.setUpdatesEnabled(True)
 
   def _clear_info_display(self):
     """Clear all information displays."""
+    # Skip the reset when nothing was shown since it last ran for this container
+    clear_key = (
+      self._selected_container_name,
+      self.loading_indicator is not None and self.loading_indicator.isVisible(),
+    )
+    if clear_key == self._last_cleared_for and self._info_labels_blank and self._plots_blank:
+      return
+    # Let Qt repaint once for the whole batch of label and plot resets
+    with self.batch_ui_updates():
+      self._reset_info_display()
+    self._last_cleared_for = clear_key
+
+  def _reset_info_display(self):
+    """Reset the info labels and plots; see _clear_info_display."""
     # Check if we're in a loading state (container starting up)
-    is_loading = hasattr(self, 'loading_indicator') and self.loading_indicator.isVisible()
+    is_loading = self.loading_indicator is not None and self.loading_indicator.isVisible()
     
     # Don't stop the loading indicator here - let the calling methods manage it
     
-    # Set text color based on theme
-    text_color = "white" if self._current_stylesheet == DARK_STYLESHEET else "black"
-    
     # Get the current container name if available
-    container_name = None
-    if hasattr(self, 'container_combo') and self.container_combo.currentIndex() >= 0:
-        container_name = self.container_combo.itemData(self.container_combo.currentIndex())
+    container_name = self._selected_container_name
     
     # Check if we have cached data for this container
     cached_data = None
@@ -2367,132 +2847,68 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     
     # If we have cached data, use it instead of clearing
     if cached_data and cached_data.node_address:
-        # Update instance variables
-        self.node_addr = cached_data.node_address
-        self.node_eth_address = cached_data.eth_address
-        self.node_name = cached_data.node_alias
-        
         # Update displays with cached data but indicate node is not running
-        if hasattr(self, 'nameDisplay') and self.node_name:
-            self.nameDisplay.setText('Name: ' + self.node_name)
-
-        if hasattr(self, 'addressDisplay') and self.node_addr:
-            if len(self.node_addr) > 24:  # Only truncate if long enough
-              str_display = f"Address: {self.node_addr[:16]}...{self.node_addr[-8:]}"
-            else:
-              str_display = f"Address: {self.node_addr}"
-            self.addressDisplay.setText(str_display)
-            # self.addressDisplay.setStyleSheet(f"color: {text_color};")
-            if hasattr(self, 'copyAddrButton'):
-                self.copyAddrButton.setVisible(True)
-        
-        if hasattr(self, 'ethAddressDisplay') and self.node_eth_address:
-            if len(self.node_eth_address) > 24:  # Only truncate if long enough
-              str_eth_display = f"ETH Address: {self.node_eth_address[:16]}...{self.node_eth_address[-8:]}"
-            else:
-              str_eth_display = f"ETH Address: {self.node_eth_address}"
-            self.ethAddressDisplay.setText(str_eth_display)
-            if hasattr(self, 'copyEthButton'):
-                self.copyEthButton.setVisible(True)
+        self._apply_container_data_to_ui(cached_data)
     else:
         # No cached data - show loading state if container is starting, otherwise show placeholder
         if is_loading:
             # Container is starting up - show loading messages instead of "Not available"
-            if hasattr(self, 'nameDisplay'):
-                self.nameDisplay.setText('Name: Loading...')
-
-            if hasattr(self, 'addressDisplay'):
-                self.addressDisplay.setText('Address: Starting up...')
-                if hasattr(self, 'copyAddrButton'):
-                    self.copyAddrButton.hide()
-            
-            if hasattr(self, 'ethAddressDisplay'):
-                self.ethAddressDisplay.setText('ETH Address: Starting up...')
-                if hasattr(self, 'copyEthButton'):
-                    self.copyEthButton.hide()
+            self.nameDisplay.setText('Name: Loading...')
+            self.addressDisplay.setText('Address: Starting up...')
+            self.ethAddressDisplay.setText('ETH Address: Starting up...')
         else:
             # Container is not loading - show neutral placeholders
-            if hasattr(self, 'nameDisplay'):
-                self.nameDisplay.setText('Name: -')
-
-            if hasattr(self, 'addressDisplay'):
-                self.addressDisplay.setText('Address: -')
-                if hasattr(self, 'copyAddrButton'):
-                    self.copyAddrButton.hide()
-            
-            if hasattr(self, 'ethAddressDisplay'):
-                self.ethAddressDisplay.setText('ETH Address: -')
-                if hasattr(self, 'copyEthButton'):
-                    self.copyEthButton.hide()
+            self.nameDisplay.setText('Name: -')
+            self.addressDisplay.setText('Address: -')
+            self.ethAddressDisplay.setText('ETH Address: -')
+        self.copyAddrButton.hide()
+        self.copyEthButton.hide()
         
         # Clear instance variables
         self.node_addr = None
         self.node_eth_address = None
         self.node_name = None
     
-    if hasattr(self, 'local_address_label'):
-        self.local_address_label.setText("Local Address: -")
-    
-    if hasattr(self, 'eth_address_label'):
-        self.eth_address_label.setText("ETH Address: -")
-    
-    if hasattr(self, 'uptime_label'):
-        self.uptime_label.setText("Uptime: -")
-    
-    if hasattr(self, 'node_uptime'):
+    # The uptime block only needs resetting if something was shown since the last clear
+    if not self._info_labels_blank:
         self.node_uptime.setText(UPTIME_LABEL)
-
-    if hasattr(self, 'node_epoch'):
         self.node_epoch.setText(EPOCH_LABEL)
-
-    if hasattr(self, 'node_epoch_avail'):
         self.node_epoch_avail.setText(EPOCH_AVAIL_LABEL)
-
-    if hasattr(self, 'node_version'):
         self.node_version.setText('')
+        self._info_labels_blank = True
+    self._last_epoch_avail = None
 
     # Reset state variables
-    if hasattr(self, '__display_uptime'):
-        self.__display_uptime = None
-    
-    if hasattr(self, '__current_node_uptime'):
-        self.__current_node_uptime = -1
-    
-    if hasattr(self, '__current_node_epoch'):
-        self.__current_node_epoch = -1
-    
-    if hasattr(self, '__current_node_epoch_avail'):
-        self.__current_node_epoch_avail = -1
-    
-    if hasattr(self, '__current_node_ver'):
-        self.__current_node_ver = -1
-    
-    if hasattr(self, '__last_plot_data'):
-        self.__last_plot_data = None
-    
-    if hasattr(self, '__last_timesteps'):
-        self.__last_timesteps = []
+    self._display_uptime = None
+    self._current_node_uptime = -1
+    self._current_node_epoch = -1
+    self._current_node_epoch_avail = -1
+    self._current_node_ver = -1
+    self._last_plot_data = None
     
     # Clear all graphs
-    if hasattr(self, 'cpu_plot'):
+    self.__last_sample_hash = None
+    if not self._plots_blank:
         self.cpu_plot.clear()
-    
-    if hasattr(self, 'memory_plot'):
         self.memory_plot.clear()
-    
-    if hasattr(self, 'gpu_plot'):
         self.gpu_plot.clear()
-    
-    if hasattr(self, 'gpu_memory_plot'):
         self.gpu_memory_plot.clear()
+        self._plots_blank = True
     
-    # Reset graph titles and labels with current theme color
-    for plot_name in ['cpu_plot', 'memory_plot', 'gpu_plot', 'gpu_memory_plot']:
-        if hasattr(self, plot_name):
-            plot = getattr(self, plot_name)
-            plot.setTitle('')
-            plot.setLabel('left', '')
-            plot.setLabel('bottom', '')
+    # Reset graph titles and labels, skipping plots that are already blank
+    for plot_name, title in self._plot_labels_state.items():
+        if not title:
+            continue
+        plot_item = getattr(self, plot_name).getPlotItem()
+        plot_item.blockSignals(True)
+        try:
+            # Blank the title text in place; PlotItem.setTitle would also re-size the
+            # title row. The left axis never gets a label, so only the bottom one is reset
+            plot_item.titleLabel.setText('')
+            plot_item.getAxis('bottom').setLabel(text='')
+        finally:
+            plot_item.blockSignals(False)
+        self._plot_labels_state[plot_name] = ''
     
     # Update toggle button state and color (commented out but updated to use new styling)
     # if hasattr(self, 'toggleButton'):
@@ -2501,9 +2917,14 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
   def open_docker_download(self):
     """Open Docker download page in default browser."""
-    import webbrowser
     webbrowser.open('https://docs.docker.com/get-docker/')
 
+  def _sync_selected_container(self, *_):
+    """Cache the container name of the current combo selection."""
+    index = self.container_combo.currentIndex()
+    self._selected_container_name = self.container_combo.itemData(index) if index >= 0 else None
+
+  @_batched_ui_updates
   def _on_container_selected(self, container_name: str):
     """Handle container selection and update dashboard display"""
     # Always clear previous container's data first to ensure no data mixing
@@ -2513,10 +2934,10 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         return
         
     try:
-        self.add_log(f"Selected container: {container_name}", debug=True)
+        self.debug_log("Selected container: %s", container_name)
         
         # Ensure loading indicator is stopped when selecting a new container
-        if hasattr(self, 'loading_indicator'):
+        if self.loading_indicator is not None:
             self.loading_indicator.stop()
         
         # Get the current index and actual container name from the data
@@ -2527,10 +2948,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                 # Update both docker handler and mixin container name
                 self.docker_handler.set_container_name(actual_container_name)
                 self.docker_container_name = actual_container_name
-                self.add_log(f"Updated container name to: {actual_container_name}", debug=True)
+                self.debug_log("Updated container name to: %s", actual_container_name)
         
-        # Check if container exists in Docker
-        container_exists = self.container_exists_in_docker(container_name)
+        # The combo shows the alias; look the container up by its real name
+        container_name = self.docker_handler.container_name or container_name
+
+        # One docker probe answers both whether the container exists and runs
+        container_exists, container_running = self._get_container_state(container_name)
         
         # Get container config
         config_container = self.config_manager.get_container(container_name)
@@ -2538,82 +2962,36 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         # If container doesn't exist in Docker but exists in config, show a message
         if not container_exists:
             if config_container:
-                self.add_log(f"Container {container_name} exists in config but not in Docker. It will be recreated when launched.", debug=True)
-                
-                # Display saved addresses if available
-                if config_container.node_address:
-                    self.node_addr = config_container.node_address
-                    if len(self.node_addr) > 24:  # Only truncate if long enough
-                      str_display = f"Address: {self.node_addr[:16]}...{self.node_addr[-8:]}"
-                    else:
-                      str_display = f"Address: {self.node_addr}"
-                    self.addressDisplay.setText(str_display)
-                    self.copyAddrButton.setVisible(True)
-                    self.add_log(f"Displaying saved node address for {container_name}", debug=True)
-                
-                if config_container.eth_address:
-                    self.node_eth_address = config_container.eth_address
-                    if len(self.node_eth_address) > 24:  # Only truncate if long enough
-                      str_eth_display = f"ETH Address: {self.node_eth_address[:16]}...{self.node_eth_address[-8:]}"
-                    else:
-                      str_eth_display = f"ETH Address: {self.node_eth_address}"
-                    self.ethAddressDisplay.setText(str_eth_display)
-                    self.copyEthButton.setVisible(True)
-                    self.add_log(f"Displaying saved ETH address for {container_name}", debug=True)
-                
-                if config_container.node_alias:
-                    self.node_name = config_container.node_alias
-                    self.nameDisplay.setText('Name: ' + config_container.node_alias)
-                    self.add_log(f"Displaying saved node alias for {container_name}", debug=True)
+                self.debug_log("Container %s exists in config but not in Docker. It will be recreated when launched.", container_name)
                 
+                # Display saved addresses and alias if available
+                self._apply_container_data_to_ui(config_container)
+                self.debug_log("Displaying saved node data for %s", container_name)
                 return
         
         # Update UI elements
         self.update_toggle_button_text()
         
         # If container is running, update all information displays
-        if self.is_container_running():
+        if container_running:
             self.post_launch_setup()
             self.refresh_node_info()  # Updates address displays with cached data
             self.plot_data()  # Updates graphs and metrics
             self.maybe_refresh_uptime()  # Updates uptime, epoch, and version info
-            self.add_log(f"Updated UI with running container data for: {container_name}", debug=True)
+            self.debug_log("Updated UI with running container data for: %s", container_name)
         else:
             # Display saved addresses from config if available
             if config_container:
-                if config_container.node_address:
-                    self.node_addr = config_container.node_address
-                    if len(self.node_addr) > 24:  # Only truncate if long enough
-                      str_display = f"Address: {self.node_addr[:16]}...{self.node_addr[-8:]}"
-                    else:
-                      str_display = f"Address: {self.node_addr}"
-                    self.addressDisplay.setText(str_display)
-                    self.copyAddrButton.setVisible(True)
-                    self.add_log(f"Displaying saved node address for {container_name}", debug=True)
-                
-                if config_container.eth_address:
-                    self.node_eth_address = config_container.eth_address
-                    if len(self.node_eth_address) > 24:  # Only truncate if long enough
-                      str_eth_display = f"ETH Address: {self.node_eth_address[:16]}...{self.node_eth_address[-8:]}"
-                    else:
-                      str_eth_display = f"ETH Address: {self.node_eth_address}"
-                    self.ethAddressDisplay.setText(str_eth_display)
-                    self.copyEthButton.setVisible(True)
-                    self.add_log(f"Displaying saved ETH address for {container_name}", debug=True)
-                
-                self.add_log(f"Container {container_name} is not running, displaying saved data", debug=True)
+                self._apply_container_data_to_ui(config_container)
+                self.debug_log("Container %s is not running, displaying saved data", container_name)
             
     except Exception as e:
         self._clear_info_display()
-        self.add_log(f"Error selecting container {container_name}: {str(e)}", debug=True, color="red")
+        self.debug_log("Error selecting container %s: %s", container_name, e, color="red")
         self.toast.show_notification(NotificationType.ERROR, f"Error selecting container: {str(e)}")
 
   def show_add_node_dialog(self):
     """Show confirmation dialog for adding a new node."""
-    from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QMessageBox
-    from utils.const import (INSUFFICIENT_RAM_TITLE, INSUFFICIENT_RAM_MESSAGE, 
-                            RAM_CHECK_ERROR_TITLE, RAM_CHECK_ERROR_MESSAGE, MIN_NODE_RAM_GB)
-
     # Check RAM before showing the dialog
     existing_node_count = len(self.config_manager.get_all_containers())
     ram_check = self.check_ram_for_new_node(existing_node_count)
@@ -2649,6 +3027,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
     # Create dialog
     dialog = QDialog(self)
+    self._track_dialog(dialog)
     dialog.setWindowTitle(ADD_NEW_NODE_DIALOG_TITLE)
     dialog.setMinimumWidth(400)
 
@@ -2684,7 +3063,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     layout.addLayout(button_layout)
 
     dialog.setLayout(layout)
-    dialog.setStyleSheet(self._current_stylesheet)  # Apply current theme
 
     # Connect buttons
     create_button.clicked.connect(lambda: self._create_node_with_name(container_name, volume_name, None, dialog))
@@ -2701,8 +3079,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     """Add a new node with the given container name and volume name,
        select it in the UI, and start it immediately."""
     try:
-      from datetime import datetime
-
       # Show the loading dialog - now with blue background
       node_display_name = display_name if display_name else None
       
@@ -2711,34 +3087,23 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       else:
         message = "Please wait while new Edge Node is being launched..."
         
-      self.startup_dialog = LoadingDialog(
-          self, 
-          title="Starting Node", 
-          message=message,
-          size=50
-      )
-      self.startup_dialog.show()
+      self._show_loading_dialog('startup_dialog', "Starting Node", message)
       
-      # Process events to ensure dialog is visible
-      QApplication.processEvents()
+      # Paint the dialog now instead of flushing the whole event queue
+      self.startup_dialog.repaint()
       
-      # Add a small delay to ensure dialog is fully rendered
-      QTimer.singleShot(100, lambda: self._perform_add_new_node(container_name, volume_name, display_name))
+      # Run the add from the event loop so the dialog stays responsive
+      QTimer.singleShot(0, lambda: self._perform_add_new_node(container_name, volume_name, display_name))
 
     except Exception as e:
       self.add_log(f"Failed to create new node: {str(e)}", color="red")
       # Close the loading dialog if it's still open
-      startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-      if startup_dialog_visible:
-        self.startup_dialog.safe_close()
-        # Schedule removal of the reference after a delay
-        QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
+      self._close_dialog('startup_dialog')
 
+  @_batched_ui_updates
   def _perform_add_new_node(self, container_name, volume_name, display_name):
     """Perform the actual node creation after the dialog is shown."""
     try:
-      from datetime import datetime
-
       # Mark that user is intentionally starting a new container (clear stop flag)
       self.user_stopped_container = False
     
@@ -2752,22 +3117,24 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       )
       self.config_manager.add_container(container_config)
 
-      # 2) Refresh the list in the combo box, so it includes the new container
-      self.refresh_container_list()
+      # 2) Refresh the list in the combo box, so it includes the new container;
+      #    skip the selection pass for the old node, the new one is selected below
+      self.refresh_container_list(notify=False)
 
       # 3) Programmatically select the newly created container in the ComboBox
-      #    We typically match itemData(...) to the container_name
-      index = -1
-      for i in range(self.container_combo.count()):
-        if self.container_combo.itemData(i) == container_name:
-          index = i
-          break
-
-      if index >= 0:
-        self.container_combo.setCurrentIndex(index)
+      #    using the name -> index map built by refresh_container_list. The
+      #    selection handler is not run: the new node has no docker state or
+      #    saved data yet, so just clear the display for it before launching
+      index = self._combo_index_by_name.get(container_name)
+      if index is not None:
+        with QSignalBlocker(self.container_combo):
+          self.container_combo.setCurrentIndex(index)
+        self._sync_selected_container()
+        self._clear_info_display()
 
-      # 4) Tell the Docker handler to manage this newly selected container
+      # 4) Tell the Docker handler (and the mixin) to manage this newly selected container
       self.docker_handler.set_container_name(container_name)
+      self.docker_container_name = container_name
 
       # 5) Actually start (launch) the container so it shows "active" in the UI
       self.launch_container(volume_name)
@@ -2786,11 +3153,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
       self.add_log(f"Failed to create new node: {str(e)}", color="red")
     finally:
       # Close the loading dialog if it's still open
-      startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-      if startup_dialog_visible:
-        self.startup_dialog.safe_close()
-        # Schedule removal of the reference after a delay
-        QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
+      self._close_dialog('startup_dialog')
 
   def launch_container(self, volume_name: str = None):
     """Launch the currently selected container with a mounted volume.
@@ -2799,6 +3162,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         volume_name: Optional volume name to mount. If None, will be retrieved from config
                     or generated based on container name.
     """
+    self._last_cleared_for = None
     container_name = self.docker_handler.container_name
     
     # If volume_name is not provided, try to get it from config
@@ -2831,8 +3195,8 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     
     try:
         # Show loading dialog if not already showing one from add_new_node or toggle_container
-        startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-        launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
+        startup_dialog_visible = self._dialog_visible('startup_dialog')
+        launcher_dialog_visible = self.launcher_dialog is not None
         
         if not startup_dialog_visible and not launcher_dialog_visible:
             # Get node alias from config if available for better user feedback
@@ -2845,22 +3209,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                 message = "Please wait while Edge Node is being launched..."
                 
             # Show loading dialog for launching operation
-            self.launcher_dialog = LoadingDialog(
-                self, 
-                title="Launching Node", 
-                message=message,
-                size=50
-            )
-            self.launcher_dialog.show()
+            self._show_loading_dialog('launcher_dialog', "Launching Node", message, progress="Preparing to launch Docker container...")
             
-            # Update message to indicate starting the launch process
-            self.launcher_dialog.update_progress("Preparing to launch Docker container...")
+            # Paint the dialog now instead of flushing the whole event queue
+            self.launcher_dialog.repaint()
             
-            # Process events to ensure dialog is visible and responsive
-            QApplication.processEvents()
-            
-            # Add a small delay to ensure dialog is fully rendered
-            QTimer.singleShot(100, lambda: self._perform_container_launch(container_name, volume_name))
+            # Run the launch from the event loop so the dialog stays responsive
+            QTimer.singleShot(0, lambda: self._perform_container_launch(container_name, volume_name))
         else:
             # If we already have a dialog visible, just perform the launch
             # If launcher_dialog is visible, update its progress message
@@ -2877,24 +3232,14 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         # Stop loading indicator on error
         self.loading_indicator.stop()
         
-        # Close the startup dialog if it exists
-        startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-        if startup_dialog_visible:
-            self.startup_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-            
-        # Close the launcher dialog if it exists
-        launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-        if launcher_dialog_visible:
-            self.launcher_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
+        # Close the loading dialogs if they exist
+        self._close_dialogs()
             
         error_msg = f"Failed to launch container: {str(e)}"
         self.add_log(error_msg, color="red")
         self.toast.show_notification(NotificationType.ERROR, error_msg)
 
+  @_batched_ui_updates
   def _perform_container_launch(self, container_name, volume_name):
     """Perform the actual container launch operation after the dialog is shown."""
     try:
@@ -2903,7 +3248,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.loading_indicator.start()
         
         # Update loading dialog with progress
-        if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
+        if self.launcher_dialog is not None:
             self.launcher_dialog.update_progress("Preparing Docker command...")
         
         # Get the Docker command that will be executed (for logging purposes only)
@@ -2915,7 +3260,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         container_exists = self.container_exists_in_docker(container_name)
         if container_exists:
             # Update loading dialog with progress
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
+            if self.launcher_dialog is not None:
                 self.launcher_dialog.update_progress(f"Removing existing container '{container_name}' before launch...")
             self.add_log(f"Container {container_name} already exists, removing it first", color="yellow")
         
@@ -2924,35 +3269,38 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             self.add_log(f"Docker pull already in progress, skipping launch of {container_name}", color="yellow")
             
             # Close any loading dialogs that might have been opened
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None:
-                self.launcher_dialog.safe_close()
-                QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
+            self._close_dialog('launcher_dialog', visible_only=False)
             
-            if hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.safe_close()
-                QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
+            self._close_dialog('startup_dialog')
             
             # Stop loading indicator
             self.loading_indicator.stop()
             return
         
-        # Always pull the latest Docker image before launching
+        # Skip the pull dialog when the image was pulled moments ago
+        if not self.docker_handler.needs_pull():
+            self.add_log("Docker image was pulled recently, skipping pull before launch", debug=True)
+            self._perform_container_launch_after_pull(container_name, volume_name)
+            return
+        
+        # Pull the latest Docker image before launching
         self.__docker_pull_in_progress = True
         
         # Stop the loading indicator since we're switching to pull dialog
         self.loading_indicator.stop()
         
         # Close the existing launcher dialog if it's open
-        if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-            self.launcher_dialog.safe_close()
-            QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
-        
-        # Show Docker pull dialog
-        from widgets.DockerPullDialog import DockerPullDialog
-        self.docker_pull_dialog = DockerPullDialog(self)
+        self._close_dialog('launcher_dialog', visible_only=False)
         
-        # Connect the pull_complete signal to handle completion
-        self.docker_pull_dialog.pull_complete.connect(self._on_docker_pull_complete)
+        # Show Docker pull dialog, reusing the one kept from a previous pull
+        if self.docker_pull_dialog is None:
+            self.docker_pull_dialog = DockerPullDialog(self)
+            self._track_dialog(self.docker_pull_dialog)
+            
+            # Connect the pull_complete signal to handle completion
+            self.docker_pull_dialog.pull_complete.connect(self._on_docker_pull_complete)
+        else:
+            self.docker_pull_dialog.reset_for_new_pull()
         
         # The container launch will continue automatically after pull completes
         
@@ -2966,183 +3314,34 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
             
             # If pull completed successfully
             if return_code == 0:
-                if hasattr(self, 'docker_pull_dialog') and self.docker_pull_dialog is not None :
+                if self.docker_pull_dialog is not None:
                     self.docker_pull_dialog.set_pull_complete(True, "Docker image pulled successfully")
             else:
                 error_msg = f"Failed to pull Docker image: {stderr}"
                 self.add_log(error_msg, color="red")
-                if hasattr(self, 'docker_pull_dialog') and self.docker_pull_dialog is not None :
+                if self.docker_pull_dialog is not None:
                     self.docker_pull_dialog.set_pull_complete(False, error_msg)
         
         def on_pull_error(error_msg):
             self.add_log(f"Error pulling Docker image: {error_msg}", color="red")
-            if hasattr(self, 'docker_pull_dialog') and self.docker_pull_dialog is not None :
+            if self.docker_pull_dialog is not None:
                 self.docker_pull_dialog.set_pull_complete(False, error_msg)
         
         def on_pull_output(line):
             # Process each line of output in real-time to update the dialog
-            if hasattr(self, 'docker_pull_dialog') and self.docker_pull_dialog is not None :
+            if self.docker_pull_dialog is not None:
                 self.docker_pull_dialog.update_pull_progress(line)
         
-        # Always pull the latest image to ensure we have the most recent version
+        # Pull the latest image to ensure we have the most recent version
         self.add_log("Pulling latest Docker image before container launch...", color="blue")
         self.docker_handler.pull_image(on_pull_success, on_pull_error, on_pull_output)
         
-        # Exit this method early - we'll continue after the pull completes
-        return
-        
-        # Update loading dialog with progress
-        if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-            self.launcher_dialog.update_progress("Launching Docker container...")
-        
-        # Define success callback for threaded operation
-        def on_launch_success(result):
-            stdout, stderr, return_code = result
-            if return_code != 0:
-                # Handle error case
-                error_msg = f"Failed to launch container: {stderr}"
-                self.add_log(error_msg, color="red")
-                self.toast.show_notification(NotificationType.ERROR, error_msg)
-                return
-            
-            # Update loading dialogs with progress    
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress("Container launched, updating configuration...")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress("Container launched, updating configuration...")
-            
-            # Update last used timestamp in config
-            from datetime import datetime
-            self.config_manager.update_last_used(container_name, datetime.now().isoformat())
-            
-            # Update volume name in config if it's not already set
-            container_config = self.config_manager.get_container(container_name)
-            if container_config and not container_config.volume:
-                self.config_manager.update_volume(container_name, volume_name)
-                self.add_log(f"Updated volume name in config: {volume_name}", debug=True)
-            
-            # Update loading dialogs with progress
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress("Updating user interface...")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress("Updating user interface...")
-            
-            # Update UI after launch
-            self.post_launch_setup()
-            self.refresh_node_info()
-            self.plot_data()
-            self.update_toggle_button_text()
-            
-            # Stop loading indicator
-            self.loading_indicator.stop()
-            
-            # Update loading dialogs with completion message
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress("Container launched successfully!")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress("Container launched successfully!")
-            
-            # Close the loading dialogs immediately
-            launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-            if launcher_dialog_visible:
-                self.launcher_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
-            
-            startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-            if startup_dialog_visible:
-                self.startup_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-            
-            # Show success notification
-            # Get node alias from config if available
-            node_display_name = container_name
-            container_config = self.config_manager.get_container(container_name)
-            if container_config and container_config.node_alias:
-                node_display_name = container_config.node_alias
-                self.toast.show_notification(NotificationType.SUCCESS, f"Node '{node_display_name}' launched successfully")
-            else:
-                self.toast.show_notification(NotificationType.SUCCESS, "Edge Node launched successfully")
-        
-        # Define error callback for threaded operation
-        def on_launch_error(error_msg):
-            # Stop loading indicator on error
-            self.loading_indicator.stop()
-            
-            # Check if this is a "container already exists" error
-            if "Conflict" in error_msg and "is already in use" in error_msg:
-                # Update loading dialogs with specific error message
-                if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                    self.launcher_dialog.update_progress("Container name conflict detected. Trying again with container removal...")
-                elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                    self.startup_dialog.update_progress("Container name conflict detected. Trying again with container removal...")
-                
-                # Try to forcefully remove the container and retry launch
-                try:
-                    # Extract container ID from error message if possible
-                    import re
-                    container_id_match = re.search(r'by container "([^"]+)"', error_msg)
-                    container_id = container_id_match.group(1) if container_id_match else None
-                    
-                    if container_id:
-                        self.add_log(f"Attempting to forcefully remove container with ID: {container_id}", color="yellow")
-                        # Run docker rm -f directly 
-                        remove_cmd = ['docker', 'rm', '-f', container_id]
-                        result = subprocess.run(remove_cmd, capture_output=True, text=True)
-                        if result.returncode == 0:
-                            self.add_log("Successfully removed conflicting container, retrying launch", color="blue")
-                            # Wait to ensure Docker has released the resources
-                            time.sleep(1)
-                            # Retry the launch
-                            self.docker_handler.launch_container_threaded(volume_name, on_launch_success, on_launch_error)
-                            return
-                except Exception as retry_err:
-                    self.add_log(f"Failed to resolve container conflict: {retry_err}", color="red")
-            
-            # Update loading dialogs with error message
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress(f"Error: {error_msg}")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress(f"Error: {error_msg}")
-            
-            # Close the loading dialogs immediately
-            launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-            if launcher_dialog_visible:
-                self.launcher_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
-            
-            startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-            if startup_dialog_visible:
-                self.startup_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-                
-            error_msg = f"Failed to launch container: {error_msg}"
-            self.add_log(error_msg, color="red")
-            self.toast.show_notification(NotificationType.ERROR, error_msg)
-        
-        # Launch the container in a thread
-        self.docker_handler.launch_container_threaded(volume_name, on_launch_success, on_launch_error)
-        
     except Exception as e:
         # Stop loading indicator on error
         self.loading_indicator.stop()
         
-        # Close the startup dialog if it exists
-        startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-        if startup_dialog_visible:
-            self.startup_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-            
-        # Close the launcher dialog if it exists
-        launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-        if launcher_dialog_visible:
-            self.launcher_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
+        # Close the loading dialogs if they exist
+        self._close_dialogs()
             
         error_msg = f"Failed to launch container: {str(e)}"
         self.add_log(error_msg, color="red")
@@ -3166,15 +3365,11 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.add_log(f"Docker image pull failed: {message}", color="red")
         logging.error(f"Docker pull failed: {message}")
         
-    # Ensure the Docker pull dialog is closed
-    # The dialog should already be closing itself via set_pull_complete, but we'll make sure
-    if hasattr(self, 'docker_pull_dialog') and self.docker_pull_dialog is not None:
-        self.docker_pull_dialog.safe_close()
-        # Remove the reference immediately
-        self.docker_pull_dialog = None
-    
-    # Process events to ensure UI updates
-    QApplication.processEvents()
+    # Ensure the Docker pull dialog is hidden
+    # The dialog should already be hiding itself via set_pull_complete, but we'll make sure;
+    # it is kept for the next pull
+    if self.docker_pull_dialog is not None:
+        self.docker_pull_dialog.hide()
     
     # If pull was successful, continue with the currently selected container launch
     if success:
@@ -3188,7 +3383,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                 if container_config and container_config.volume:
                     volume_name = container_config.volume
                 else:
-                    from utils.docker_utils import get_volume_name
                     volume_name = get_volume_name(container_name)
                 
                 # Show the launcher dialog for the container launch
@@ -3201,22 +3395,13 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                     message = "Please wait while Edge Node is being launched..."
                     
                 # Show loading dialog for launching operation
-                self.launcher_dialog = LoadingDialog(
-                    self, 
-                    title="Launching Node", 
-                    message=message,
-                    size=50
-                )
-                self.launcher_dialog.show()
-                
-                # Update message to indicate starting the launch process
-                self.launcher_dialog.update_progress("Preparing to launch Docker container...")
+                self._show_loading_dialog('launcher_dialog', "Launching Node", message, progress="Preparing to launch Docker container...")
                 
-                # Process events to ensure dialog is visible and responsive
-                QApplication.processEvents()
+                # Paint the dialog now instead of flushing the whole event queue
+                self.launcher_dialog.repaint()
                 
-                # Continue with container launch after pull - use a short timer to ensure UI is updated first
-                QTimer.singleShot(100, lambda: self._perform_container_launch_after_pull(container_name, volume_name))
+                # Continue with container launch after pull once the queued UI updates have run
+                QTimer.singleShot(0, lambda: self._perform_container_launch_after_pull(container_name, volume_name))
             else:
                 self.add_log("No container selected after Docker pull completion", color="yellow")
         else:
@@ -3232,171 +3417,144 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.loading_indicator.start()
         
         # Update loading dialog with progress
-        if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
+        if self.launcher_dialog is not None:
             self.launcher_dialog.update_progress("Launching Docker container...")
         
-        # Define success callback for threaded operation
-        def on_launch_success(result):
-            stdout, stderr, return_code = result
-            if return_code != 0:
-                # Handle error case
-                error_msg = f"Failed to launch container: {stderr}"
-                self.add_log(error_msg, color="red")
-                self.toast.show_notification(NotificationType.ERROR, error_msg)
-                return
-            
-            # Update loading dialogs with progress    
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress("Container launched, updating configuration...")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress("Container launched, updating configuration...")
-            
-            # Update last used timestamp in config
-            from datetime import datetime
-            self.config_manager.update_last_used(container_name, datetime.now().isoformat())
-            
-            # Update volume name in config if it's not already set
-            container_config = self.config_manager.get_container(container_name)
-            if container_config and not container_config.volume:
-                self.config_manager.update_volume(container_name, volume_name)
-                self.add_log(f"Updated volume name in config: {volume_name}", debug=True)
-            
-            # Update loading dialogs with progress
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress("Updating user interface...")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress("Updating user interface...")
-            
-            # Update UI after launch
-            self.post_launch_setup()
-            self.refresh_node_info()
-            self.plot_data()
-            self.update_toggle_button_text()
-            
-            # Stop loading indicator
-            self.loading_indicator.stop()
-            
-            # Update loading dialogs with completion message
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress("Container launched successfully!")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress("Container launched successfully!")
-            
-            # Close the loading dialogs immediately
-            launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-            if launcher_dialog_visible:
-                self.launcher_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
-            
-            startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-            if startup_dialog_visible:
-                self.startup_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-            
-            # Show success notification
-            # Get node alias from config if available
-            node_display_name = container_name
-            container_config = self.config_manager.get_container(container_name)
-            if container_config and container_config.node_alias:
-                node_display_name = container_config.node_alias
-                self.toast.show_notification(NotificationType.SUCCESS, f"Node '{node_display_name}' launched successfully")
-            else:
-                self.toast.show_notification(NotificationType.SUCCESS, "Edge Node launched successfully")
-        
-        # Define error callback for threaded operation
-        def on_launch_error(error_msg):
-            # Stop loading indicator on error
-            self.loading_indicator.stop()
-            
-            # Check if this is a "container already exists" error
-            if "Conflict" in error_msg and "is already in use" in error_msg:
-                # Update loading dialogs with specific error message
-                if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                    self.launcher_dialog.update_progress("Container name conflict detected. Trying again with container removal...")
-                elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                    self.startup_dialog.update_progress("Container name conflict detected. Trying again with container removal...")
-                
-                # Try to forcefully remove the container and retry launch
-                try:
-                    # Extract container ID from error message if possible
-                    import re
-                    container_id_match = re.search(r'by container "([^"]+)"', error_msg)
-                    container_id = container_id_match.group(1) if container_id_match else None
-                    
-                    if container_id:
-                        self.add_log(f"Attempting to forcefully remove container with ID: {container_id}", color="yellow")
-                        # Run docker rm -f directly 
-                        remove_cmd = ['docker', 'rm', '-f', container_id]
-                        result = subprocess.run(remove_cmd, capture_output=True, text=True)
-                        if result.returncode == 0:
-                            self.add_log("Successfully removed conflicting container, retrying launch", color="blue")
-                            # Wait to ensure Docker has released the resources
-                            time.sleep(1)
-                            # Retry the launch
-                            self.docker_handler.launch_container_threaded(volume_name, on_launch_success, on_launch_error)
-                            return
-                except Exception as retry_err:
-                    self.add_log(f"Failed to resolve container conflict: {retry_err}", color="red")
-            
-            # Update loading dialogs with error message
-            if hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None :
-                self.launcher_dialog.update_progress(f"Error: {error_msg}")
-            elif hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible():
-                self.startup_dialog.update_progress(f"Error: {error_msg}")
-            
-            # Close the loading dialogs immediately
-            launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-            if launcher_dialog_visible:
-                self.launcher_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
-            
-            startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-            if startup_dialog_visible:
-                self.startup_dialog.safe_close()
-                # Schedule removal of the reference after a delay
-                QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-                
-            error_msg = f"Failed to launch container: {error_msg}"
-            self.add_log(error_msg, color="red")
-            self.toast.show_notification(NotificationType.ERROR, error_msg)
-        
         # Launch the container in a thread (without pulling again)
-        self.docker_handler.launch_container_threaded(volume_name, on_launch_success, on_launch_error)
+        self._launch_container_threaded(container_name, volume_name)
         
     except Exception as e:
         # Stop loading indicator on error
         self.loading_indicator.stop()
         
-        # Close the startup dialog if it exists
-        startup_dialog_visible = hasattr(self, 'startup_dialog') and self.startup_dialog is not None and self.startup_dialog.isVisible()
-        if startup_dialog_visible:
-            self.startup_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'startup_dialog', None) if hasattr(self, 'startup_dialog') else None)
-            
-        # Close the launcher dialog if it exists
-        launcher_dialog_visible = hasattr(self, 'launcher_dialog') and self.launcher_dialog is not None 
-        if launcher_dialog_visible:
-            self.launcher_dialog.safe_close()
-            # Schedule removal of the reference after a delay
-            QTimer.singleShot(500, lambda: setattr(self, 'launcher_dialog', None) if hasattr(self, 'launcher_dialog') else None)
+        # Close the loading dialogs if they exist
+        self._close_dialogs()
             
         error_msg = f"Failed to launch container: {str(e)}"
         self.add_log(error_msg, color="red")
         self.toast.show_notification(NotificationType.ERROR, error_msg)
+
+  def _launch_container_threaded(self, container_name, volume_name):
+    """Start the threaded launch with the shared success/error handlers bound to this container."""
+    self.docker_handler.launch_container_threaded(
+        volume_name,
+        partial(self._on_launch_success, container_name, volume_name),
+        partial(self._on_launch_error, container_name, volume_name)
+    )
+
+  def _on_launch_success(self, container_name, volume_name, result):
+    """Finish a threaded launch: update the config and UI, then close the loading dialogs."""
+    stdout, stderr, return_code = result
+    self._invalidate_container_state(container_name)
+    if return_code != 0:
+        # Handle error case
+        error_msg = f"Failed to launch container: {stderr}"
+        self.add_log(error_msg, color="red")
+        self.toast.show_notification(NotificationType.ERROR, error_msg)
+        return
+    
+    # Update loading dialogs with progress    
+    self._progress("Container launched, updating configuration...")
+    
+    # Update last used timestamp in config
+    self.config_manager.update_last_used(container_name, datetime.now().isoformat())
+    
+    # Update volume name in config if it's not already set
+    container_config = self.config_manager.get_container(container_name)
+    if container_config and not container_config.volume:
+        self.config_manager.update_volume(container_name, volume_name)
+        self.add_log(f"Updated volume name in config: {volume_name}", debug=True)
+    
+    # Update loading dialogs with progress
+    self._progress("Updating user interface...")
+    
+    # Update UI after launch
+    self.post_launch_setup()
+    self.refresh_node_info()
+    self.plot_data()
+    self.update_toggle_button_text()
+    
+    # Stop loading indicator
+    self.loading_indicator.stop()
+    
+    # Update loading dialogs with completion message
+    self._progress("Container launched successfully!")
+    
+    # Close the loading dialogs immediately
+    self._close_dialogs()
+    
+    # Show success notification
+    # Get node alias from config if available
+    node_display_name = container_name
+    if container_config and container_config.node_alias:
+        node_display_name = container_config.node_alias
+        self.toast.show_notification(NotificationType.SUCCESS, f"Node '{node_display_name}' launched successfully")
+    else:
+        self.toast.show_notification(NotificationType.SUCCESS, "Edge Node launched successfully")
+
+  def _on_launch_error(self, container_name, volume_name, error_msg):
+    """Handle a failed threaded launch, retrying once a conflicting container is removed."""
+    # Stop loading indicator on error
+    self.loading_indicator.stop()
+    
+    # Check if this is a "container already exists" error
+    if "Conflict" in error_msg and "is already in use" in error_msg:
+        # Update loading dialogs with specific error message
+        self._progress("Container name conflict detected. Trying again with container removal...")
+        
+        # Try to forcefully remove the container and retry launch
+        try:
+            # Extract container ID from error message if possible
+            container_id_match = _CONTAINER_CONFLICT_RE.search(error_msg)
+            container_id = container_id_match.group(1) if container_id_match else None
+            
+            if container_id:
+                self.add_log(f"Attempting to forcefully remove container with ID: {container_id}", color="yellow")
+                # Remove it off the UI thread (and on the remote host when connected over SSH)
+                self.docker_handler.remove_container_threaded(
+                    container_id,
+                    partial(self._on_conflict_removed, container_name, volume_name, container_id, time()),
+                    partial(self._on_launch_error, container_name, volume_name)
+                )
+                return
+        except Exception as retry_err:
+            self.add_log(f"Failed to resolve container conflict: {retry_err}", color="red")
+    
+    # Update loading dialogs with error message
+    self._progress(f"Error: {error_msg}")
+    
+    # Close the loading dialogs immediately
+    self._close_dialogs()
+        
+    error_msg = f"Failed to launch container: {error_msg}"
+    self.add_log(error_msg, color="red")
+    self.toast.show_notification(NotificationType.ERROR, error_msg)
+
+  def _on_conflict_removed(self, container_name, volume_name, container_id, removal_started, result):
+    """Retry the launch once the container blocking its name has been removed."""
+    stdout, stderr, return_code = result
+    if return_code != 0:
+        self._on_launch_error(container_name, volume_name, f"Failed to remove conflicting container: {stderr}")
+        return
+    self.add_log("Successfully removed conflicting container, retrying launch", color="blue")
+    # Retry as soon as Docker reports the container destroyed (bounded by a short timeout)
+    self.docker_handler.wait_for_destroy(
+        container_id,
+        lambda: self._launch_container_threaded(container_name, volume_name),
+        since=removal_started
+    )
   
-  def refresh_container_list(self):
-    """Refresh the container list in the combo box."""
+  def refresh_container_list(self, notify=True):
+    """Refresh the container list in the combo box.
+
+    Args:
+        notify: Run _on_container_selected for the resulting selection. Callers that
+                select another item right afterwards pass False to skip that pass.
+    """
     # Store current selection
     current_index = self.container_combo.currentIndex()
     selected_container = self.container_combo.itemData(current_index) if current_index >= 0 else None
     
-    # Clear the combo box
-    self.container_combo.clear()
-    
     # Get containers from config
     containers = self.config_manager.get_all_containers()
     
@@ -3410,31 +3568,46 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.config_manager.add_container(default_container)
         containers = [default_container]
     
-    # Sort containers by name
-    containers.sort(key=lambda x: x.name.lower())
-    
-    # Add containers to combo box
-    for container in containers:
-        # Use node alias if available, otherwise use container name
-        display_text = container.node_alias if container.node_alias else container.name
-        self.container_combo.addItem(display_text, container.name)
+    # Sort containers by name (a sorted copy, the config manager keeps its own order)
+    containers = sorted(containers, key=lambda x: x.name.lower())
     
-    # Center align all items in the dropdown is now handled by our CenteredComboBox class
-    
-    # Restore previous selection if it exists
-    if selected_container:
-        index = -1
-        for i in range(self.container_combo.count()):
-            if self.container_combo.itemData(i) == selected_container:
-                index = i
-                break
-        if index >= 0:
-            self.container_combo.setCurrentIndex(index)
-    elif self.container_combo.count() > 0:
-        # If no previous selection or it wasn't found, select the first item
-        self.container_combo.setCurrentIndex(0)
+    # Rebuild with signals blocked and painting suspended so the selection handler
+    # runs once at the end and the combo repaints once, not per item
+    combo = self.container_combo
+    combo.setUpdatesEnabled(False)
+    blocker = QSignalBlocker(combo)
+    try:
+        # Clear the combo box
+        combo.clear()
+        
+        # Add containers to combo box, keeping a name -> index map for selection restores
+        self._combo_index_by_name = {}
+        for i, container in enumerate(containers):
+            # Use node alias if available, otherwise use container name
+            display_text = container.node_alias if container.node_alias else container.name
+            combo.addItem(display_text, container.name)
+            self._combo_index_by_name[container.name] = i
+        
+        # Center align all items in the dropdown is now handled by our CenteredComboBox class
+        
+        # Restore previous selection if it exists
+        if selected_container:
+            index = self._combo_index_by_name.get(selected_container)
+            if index is not None:
+                combo.setCurrentIndex(index)
+        elif combo.count() > 0:
+            # If no previous selection or it wasn't found, select the first item
+            combo.setCurrentIndex(0)
+    finally:
+        blocker.unblock()
+        combo.setUpdatesEnabled(True)
+        combo.update()
+
+    self._sync_selected_container()
+    if notify:
+        self._on_container_selected(self.container_combo.currentText())
 
-    self.add_log(f'Displayed {self.container_combo.count()} containers in dropdown', debug=True)
+    self.debug_log('Displayed %s containers in dropdown', self.container_combo.count())
 
   def is_container_running(self):
     """Check if the currently selected container is running.
@@ -3443,33 +3616,60 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         bool: True if the container is running, False otherwise
     """
     try:
-        # Get the current index and container name from the data
-        current_index = self.container_combo.currentIndex()
-        if current_index < 0:
-            return False
-            
-        # Get the actual container name from the item data
-        container_name = self.container_combo.itemData(current_index)
+        # Get the actual container name of the current selection
+        container_name = self._selected_container_name
         if not container_name:
             return False
             
         # Make sure the docker handler has the correct container name
         self.docker_handler.set_container_name(container_name)
         
-        # Use the docker_handler's is_container_running method directly
-        is_running = self.docker_handler.is_container_running()
+        _, is_running = self._get_container_state(container_name)
         
         # Log status changes for debugging
         if hasattr(self, 'container_last_run_status') and self.container_last_run_status != is_running:
-            self.add_log(f'Container {container_name} status changed: {self.container_last_run_status} -> {is_running}', debug=True)
+            self.debug_log('Container %s status changed: %s -> %s', container_name, self.container_last_run_status, is_running)
             self.container_last_run_status = is_running
             
         return is_running
     except Exception as e:
-        self.add_log(f"Error checking if container is running: {str(e)}", debug=True, color="red")
+        self.debug_log("Error checking if container is running: %s", e, color="red")
         return False
 
 
+  def _get_container_state(self, container_name):
+    """Return (exists, running) for a container with at most one docker call.
+
+    The state is taken from the current refresh snapshot, then from the docker
+    events stream, and only then from a single `docker inspect`.
+    """
+    snapshot = self._refresh_snapshot
+    if snapshot is not None and snapshot[0] == container_name:
+        return snapshot[1], snapshot[2]
+
+    state = None
+    if self._docker_events_streaming():
+        state = self._container_states.get(container_name)
+    if state is None:
+        # Reuse a very recent answer so back-to-back callers share one probe
+        cached = self._is_running_cache.get(container_name)
+        if cached is not None and monotonic() - cached[0] < IS_RUNNING_CACHE_TTL:
+            return cached[1]
+        stdout, _, return_code = self.docker_handler.execute_command(
+            ['docker', 'inspect', '--format', '{{.State.Running}}', container_name]
+        )
+        # inspect fails for unknown containers, so the return code doubles as an existence check
+        state = (return_code == 0, return_code == 0 and stdout.strip() == 'true')
+        self._is_running_cache[container_name] = (monotonic(), state)
+        if self._docker_events_streaming():
+            self._container_states[container_name] = state
+    return state
+
+  def _invalidate_container_state(self, container_name):
+    """Drop cached docker state for a container after starting, launching or stopping it."""
+    self._is_running_cache.pop(container_name, None)
+    self._container_name_set_cache = None
+
   def container_exists_in_docker(self, container_name: str) -> bool:
     """Check if a container exists in Docker.
     
@@ -3480,14 +3680,22 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         bool: True if the container exists in Docker, False otherwise
     """
     try:
-        # Check directly with docker ps command
-        stdout, stderr, return_code = self.docker_handler.execute_command(['docker', 'ps', '-a', '--format', '{{.Names}}', '--filter', f'name={container_name}'])
-        if return_code == 0:
-            containers = [name.strip() for name in stdout.split('\n') if name.strip() and name.strip() == container_name]
-            return len(containers) > 0
-        return False
+        # A state tracked from the docker events stream answers without any docker call
+        if self._docker_events_streaming():
+            state = self._container_states.get(container_name)
+            if state is not None:
+                return state[0]
+        # One `docker ps -a` listing answers for every container for a short while
+        cached = self._container_name_set_cache
+        if cached is None or monotonic() - cached[0] >= CONTAINER_NAMES_CACHE_TTL:
+            stdout, stderr, return_code = self.docker_handler.execute_command(['docker', 'ps', '-a', '--format', '{{.Names}}'])
+            if return_code != 0:
+                return False
+            names = frozenset(name.strip() for name in stdout.split('\n') if name.strip())
+            cached = self._container_name_set_cache = (monotonic(), names)
+        return container_name in cached[1]
     except Exception as e:
-        self.add_log(f"Error checking if container exists in Docker: {str(e)}", debug=True, color="red")
+        self.debug_log("Error checking if container exists in Docker: %s", e, color="red")
         return False
 
   def post_launch_setup(self):
@@ -3500,7 +3708,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     super().post_launch_setup()
     
     # Ensure loading indicator is stopped after launch
-    if hasattr(self, 'loading_indicator'):
+    if self.loading_indicator is not None:
         self.loading_indicator.stop()
     
     # Update button state to show container is running
@@ -3511,12 +3719,52 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     # Log the setup
     self.add_log('Post-launch setup completed', debug=True)
     
-    # Process events to update UI immediately
-    QApplication.processEvents()
-    
     return
 
 
+  def _maybe_plot_data(self, dispatch=True):
+    """Run plot_data unless it was dispatched less than REFRESH_MIN_INTERVAL ago."""
+    now = monotonic()
+    if now - self._last_plot_ts < REFRESH_MIN_INTERVAL:
+      self.add_log("Plot data requested too soon, skipping", debug=True)
+      return None
+    self._last_plot_ts = now
+    return self.plot_data(dispatch=dispatch)
+
+  def _refresh_node_info_and_plot(self):
+    """Refresh node info and metrics, using one docker exec when both are due."""
+    info_handlers = self.refresh_node_info(dispatch=False)
+    plot_handlers = self._maybe_plot_data(dispatch=False)
+    if info_handlers is None:
+      if plot_handlers is not None:
+        self.docker_handler.get_node_history(*plot_handlers)
+      return
+    if plot_handlers is None:
+      self._request_node_info(*info_handlers)
+      return
+
+    history_success, history_error = plot_handlers
+
+    def fetch_both(info_success, info_error):
+      def on_error(error):
+        # The combined call also fails when only the history half is broken, so
+        # only a failure of get_node_info on its own counts toward the restart threshold
+        history_error(error)
+        self.docker_handler.get_node_info(info_success, info_error)
+      self.docker_handler.get_node_info_and_history(info_success, history_success, on_error)
+
+    if not self._request_node_info(*info_handlers, fetch=fetch_both):
+      # Joined a pending node info request, so fetch the metrics on their own
+      self.docker_handler.get_node_history(history_success, history_error)
+
+  def _maybe_update_resources(self):
+    """Run update_resources_display unless it ran less than REFRESH_MIN_INTERVAL ago."""
+    now = monotonic()
+    if now - self._last_resources_ts < REFRESH_MIN_INTERVAL:
+      return
+    self._last_resources_ts = now
+    self.update_resources_display()
+
   def update_resources_display(self):
     """Update the system resources display with current information."""
     try:
@@ -3533,7 +3781,7 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         self.add_log("Updated system resources display", debug=True)
 
     except Exception as e:
-        self.add_log(f"Error updating resources display: {str(e)}", debug=True)
+        self.debug_log("Error updating resources display: %s", e)
         # Set fallback values on error
         self.memoryDisplay.setText(f"{MEMORY_LABEL} {MEMORY_NOT_AVAILABLE}")
         self.vcpusDisplay.setText(f"{VCPUS_LABEL} {VCPUS_NOT_AVAILABLE}")
@@ -3549,14 +3797,38 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
     
     # Set the flags to indicate update process is starting
     self.__update_in_progress = True
-    
+
+    self._update_check_verbose = verbose
+    # A release fetched a few minutes ago is reused without another GitHub request
+    cached = cached_latest_release()
+    self._update_check_cached = cached is not None
+    if cached is not None:
+        self._on_latest_release_version(cached)
+        return
+
+    # Query GitHub on the thread pool; the result is handled on the GUI thread
+    self._update_worker = DockerWorker(self.get_latest_release_version)
+    self._update_worker.signals.result.connect(self._on_latest_release_version)
+    self._update_worker.signals.error.connect(self._on_update_check_error)
+    self._update_worker.start()
+
+  def _on_update_check_error(self, error):
+    self._update_worker = None
+    self.add_log(f"Error during update check: {error}", color="red")
+    self.__update_dialog_shown = False
+    self.__update_in_progress = False
+
+  def _on_latest_release_version(self, result):
+    """Compare the latest release with the current version and offer the update."""
+    self._update_worker = None
+    verbose = self._update_check_verbose
     try:
         # Implement the update check logic directly here to control dialog display
-        latest_version, download_urls = self.get_latest_release_version()
+        latest_version, download_urls = result
         latest_version = latest_version.lstrip('v').strip().replace('"', '').replace("'", '')
         
         if verbose:
-            self.add_log(f'Obtained latest version: {latest_version}')
+            self.add_log(f'Obtained latest version: {latest_version}{" (cached)" if self._update_check_cached else ""}')
         
         # Compare versions using the parent method
         if self._compare_versions(CURRENT_VERSION, latest_version):
@@ -3565,8 +3837,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
                 self.__update_dialog_shown = True
                 
                 try:
-                    from PyQt5.QtWidgets import QMessageBox
-
                     reply = QMessageBox.question(
                         self, 'Update Available',
                         f'A new version v{latest_version} is available (current v{CURRENT_VERSION}). Do you want to update?',
@@ -3598,9 +3868,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
 
   def _proceed_with_update(self, latest_version, download_urls):
     """Handle the update process after user confirmation."""
-    import platform
-    from PyQt5.QtWidgets import QMessageBox
-    
     platform_system = platform.system()
     
     try:
@@ -3618,8 +3885,6 @@ class EdgeNodeLauncher(QWidget, _DockerUtilsMixin, _UpdaterMixin, _SystemResourc
         return
     
     # Use user's temp directory for downloads to avoid permission issues
-    import sys
-    import os
     if sys.platform == "win32":
         download_dir = os.path.join(os.environ.get('LOCALAPPDATA') or os.environ.get('APPDATA'), 'EdgeNodeLauncher', 'updates')
     else:
@@ -117,7 +117,7 @@ class DateAxisItem(AxisItem):
     return
 
   def tickStrings(self, values, scale, spacing):
-    if not self.timestamps or len(self.timestamps) == 0:
+    if self.timestamps is None or len(self.timestamps) == 0:
       return [""] * len(values)  # Return empty labels if no timestamps available
 
     # Get the range of actual timestamps
@@ -1,24 +1,33 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
+import numpy as np
+
+
+def _as_series(values) -> Optional[np.ndarray]:
+    """Convert a list of samples to a float64 array once at ingest (None becomes NaN)."""
+    if values is None:
+        return None
+    return np.asarray(values, dtype=np.float64)
+
 @dataclass
 class NodeHistory:
     address: str
     alias: str
-    cpu_load: List[float]
-    cpu_temp: List[float]
+    cpu_load: np.ndarray
+    cpu_temp: np.ndarray
     current_epoch: int
     current_epoch_avail: float
     eth_address: str
-    gpu_load: Optional[List[float]]
-    gpu_occupied_memory: Optional[List[float]]
-    gpu_temp: Optional[List[float]]
-    gpu_total_memory: Optional[List[float]]
+    gpu_load: Optional[np.ndarray]
+    gpu_occupied_memory: Optional[np.ndarray]
+    gpu_temp: Optional[np.ndarray]
+    gpu_total_memory: Optional[np.ndarray]
     last_epochs: List[int]
     last_save_time: str
-    occupied_memory: List[float]
+    occupied_memory: np.ndarray
     timestamps: List[str]
-    total_memory: List[float]
+    total_memory: np.ndarray
     uptime: str
     version: str
 
@@ -33,20 +42,20 @@ class NodeHistory:
         return cls(
             address=data['address'],
             alias=data['alias'],
-            cpu_load=data['cpu_load'],
-            cpu_temp=data['cpu_temp'],
+            cpu_load=_as_series(data['cpu_load']),
+            cpu_temp=_as_series(data['cpu_temp']),
             current_epoch=data['current_epoch'],
             current_epoch_avail=data['current_epoch_avail'],
             eth_address=data['eth_address'],
-            gpu_load=data.get('gpu_load'),
-            gpu_occupied_memory=data.get('gpu_occupied_memory'),
-            gpu_temp=data.get('gpu_temp'),
-            gpu_total_memory=data.get('gpu_total_memory'),
+            gpu_load=_as_series(data.get('gpu_load')),
+            gpu_occupied_memory=_as_series(data.get('gpu_occupied_memory')),
+            gpu_temp=_as_series(data.get('gpu_temp')),
+            gpu_total_memory=_as_series(data.get('gpu_total_memory')),
             last_epochs=data['last_epochs'],
             last_save_time=data['last_save_time'],
-            occupied_memory=data['occupied_memory'],
+            occupied_memory=_as_series(data['occupied_memory']),
             timestamps=data['timestamps'],
-            total_memory=data['total_memory'],
+            total_memory=_as_series(data['total_memory']),
             uptime=data['uptime'],
             version=data['version']
         )
\ No newline at end of file
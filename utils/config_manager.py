@@ -1,12 +1,36 @@
 import os
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
+from time import monotonic
 from typing import List, Dict, Optional, Any
 from utils.const import CONFIG_DIR
 
+# Seconds between checks of the containers file for changes made outside the app
+CONTAINERS_FILE_CHECK_INTERVAL = 2.0
+
+# Label templates, bound once so formatting only passes the pieces
+_ADDRESS_LABEL_TPL = "{}: {}".format
+_TRUNCATED_ADDRESS_LABEL_TPL = "{}: {}...{}".format
+
+
+@lru_cache(maxsize=64)
+def format_address_label(prefix: str, address: str) -> str:
+    """Format an address for an info label, truncating long addresses.
+
+    Results are memoized so repeated selections reuse the same string.
+    """
+    if len(address) > 24:  # Only truncate if long enough
+        return _TRUNCATED_ADDRESS_LABEL_TPL(prefix, address[:16], address[-8:])
+    return _ADDRESS_LABEL_TPL(prefix, address)
+
+
 # Container configuration structure
 class ContainerConfig:
+    __slots__ = ('name', 'volume', 'created_at', 'last_used',
+                 'node_address', 'eth_address', 'node_alias')
+
     def __init__(self, name: str, volume: str, created_at: str = None, last_used: str = None, 
                  node_address: str = None, eth_address: str = None, node_alias: str = None):
         self.name = name
@@ -16,6 +40,16 @@ class ContainerConfig:
         self.node_address = node_address
         self.eth_address = eth_address
         self.node_alias = node_alias
+
+    @property
+    def display_node_addr(self) -> str:
+        """Node address label text, e.g. 'Address: 0xai_Ak...'."""
+        return format_address_label("Address", self.node_address) if self.node_address else "Address: -"
+
+    @property
+    def display_eth_addr(self) -> str:
+        """ETH address label text, e.g. 'ETH Address: 0x12...'."""
+        return format_address_label("ETH Address", self.eth_address) if self.eth_address else "ETH Address: -"
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -63,6 +97,10 @@ class ConfigManager:
         self.settings_file = os.path.join(self.config_dir, "settings.json")
         self.containers: List[ContainerConfig] = []
         self.settings = {}
+        # name -> ContainerConfig index, valid while the file mtime matches
+        self._cache: Dict[str, ContainerConfig] = {}
+        self._cache_mtime = None
+        self._last_mtime_check = 0.0
         
         # Load existing configurations
         self.load_containers()
@@ -75,16 +113,45 @@ class ConfigManager:
                 with open(self.containers_file, 'r') as f:
                     data = json.load(f)
                     self.containers = [ContainerConfig.from_dict(item) for item in data]
+            self._reindex()
             return self.containers
         except Exception as e:
             logging.error(f"Error loading container configurations: {str(e)}")
+            # Keep the last good index, but remember this file version so the
+            # broken file is not re-read (and re-logged) until it changes again
+            self._cache_mtime = self._file_mtime()
             return []
+
+    def _file_mtime(self) -> Optional[int]:
+        """Return the containers file mtime in ns, or None if it is missing."""
+        try:
+            return os.stat(self.containers_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _reindex(self) -> None:
+        """Rebuild the name index and remember the file mtime it matches."""
+        self._cache = {container.name: container for container in self.containers}
+        self._cache_mtime = self._file_mtime()
+
+    def _ensure_fresh(self) -> None:
+        """Reload the containers only if the file changed on disk since the last read/write.
+
+        The file is stat'ed at most once per CONTAINERS_FILE_CHECK_INTERVAL.
+        """
+        now = monotonic()
+        if now - self._last_mtime_check < CONTAINERS_FILE_CHECK_INTERVAL:
+            return
+        self._last_mtime_check = now
+        if self._file_mtime() != self._cache_mtime:
+            self.load_containers()
     
     def save_containers(self) -> bool:
         """Save container configurations to file."""
         try:
             with open(self.containers_file, 'w') as f:
                 json.dump([container.to_dict() for container in self.containers], f, indent=2)
+            self._reindex()
             return True
         except Exception as e:
             logging.error(f"Error saving container configurations: {str(e)}")
@@ -93,18 +160,18 @@ class ConfigManager:
     def add_container(self, container: ContainerConfig) -> bool:
         """Add a new container configuration."""
         # Check if container already exists
-        for existing in self.containers:
-            if existing.name == container.name:
-                # Update existing container
-                existing.volume = container.volume
-                existing.created_at = container.created_at
-                existing.last_used = container.last_used
-                # Preserve addresses if they exist and new ones are not provided
-                if container.node_address:
-                    existing.node_address = container.node_address
-                if container.eth_address:
-                    existing.eth_address = container.eth_address
-                return self.save_containers()
+        existing = self.get_container(container.name)
+        if existing:
+            # Update existing container
+            existing.volume = container.volume
+            existing.created_at = container.created_at
+            existing.last_used = container.last_used
+            # Preserve addresses if they exist and new ones are not provided
+            if container.node_address:
+                existing.node_address = container.node_address
+            if container.eth_address:
+                existing.eth_address = container.eth_address
+            return self.save_containers()
         
         # Add new container
         self.containers.append(container)
@@ -117,13 +184,12 @@ class ConfigManager:
     
     def get_container(self, container_name: str) -> Optional[ContainerConfig]:
         """Get a container configuration by name."""
-        for container in self.containers:
-            if container.name == container_name:
-                return container
-        return None
+        self._ensure_fresh()
+        return self._cache.get(container_name)
     
     def get_all_containers(self) -> List[ContainerConfig]:
         """Get all container configurations."""
+        self._ensure_fresh()
         return self.containers
     
     def update_last_used(self, container_name: str, timestamp: str) -> bool:
@@ -192,6 +258,40 @@ class ConfigManager:
             logging.error(f"Error updating node alias: {str(e)}")
             return False
     
+    def update_container_fields(self, container_name: str, node_address: str = None,
+                                eth_address: str = None, node_alias: str = None) -> bool:
+        """Update several node fields of a container with a single save.
+        
+        Fields passed as None are left untouched, and the file is only written
+        when at least one value actually changed.
+        
+        Args:
+            container_name: Name of the container
+            node_address: Node address to save
+            eth_address: ETH address to save
+            node_alias: Node alias to save
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            container = self.get_container(container_name)
+            if not container:
+                return False
+            changed = False
+            for field, value in (('node_address', node_address),
+                                 ('eth_address', eth_address),
+                                 ('node_alias', node_alias)):
+                if value is not None and getattr(container, field) != value:
+                    setattr(container, field, value)
+                    changed = True
+            if changed:
+                return self.save_containers()
+            return True
+        except Exception as e:
+            logging.error(f"Error updating container fields: {str(e)}")
+            return False
+    
     def update_volume(self, container_name: str, volume_name: str) -> bool:
         """Update the volume name for a container.
         
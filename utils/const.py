@@ -30,9 +30,20 @@ DOCKER_VOLUME_PATH = '/edge_node/_local_cache'
 REFRESH_TIME = 20_000
 MAX_HISTORY_QUEUE = 5 * 60 // 10  # 5 minutes @ 10 seconds each hb
 AUTO_UPDATE_CHECK_INTERVAL = 3600 # 1 hour
+UPDATE_CHECK_STARTUP_DELAY = 2000  # Milliseconds to wait after startup before checking for updates
 DOCKER_IMAGE_AUTO_UPDATE_CHECK_INTERVAL = 300  # 5 minutes
 MAX_ALIAS_LENGTH = 15  # Maximum length for aliases (node name and authorized addresses)
 NODE_INFO_FAILURE_THRESHOLD = 5  # Number of consecutive get_node_info failures before container restart
+LOG_FLUSH_INTERVAL = 80  # Milliseconds between batched log view updates
+LOG_MAX_BLOCK_COUNT = 5000  # Maximum number of lines kept in the log view
+DOCKER_EVENT_ACTIONS = ('start', 'die', 'destroy')  # Container events that trigger a refresh
+DOCKER_EVENT_REFRESH_DELAY = 500  # Milliseconds to coalesce bursts of docker events
+DOCKER_EVENTS_RESTART_DELAY = 5000  # Milliseconds before restarting a dead docker events stream
+IS_RUNNING_CACHE_TTL = 2.0  # Seconds a docker inspect answer is reused for
+NODE_INFO_INFLIGHT_TIMEOUT = 130  # Seconds after which a pending get_node_info request is no longer joined
+POST_START_POLL_DELAYS = (250, 500, 1000, 2000, 4000)  # Milliseconds between running checks after an auto-restart
+REFRESH_MIN_INTERVAL = 0.5  # Seconds between throttled plot/resources refreshes
+CONTAINER_NAMES_CACHE_TTL = 2.0  # Seconds a `docker ps -a` name listing is reused for
 
 # ============================================================================
 # NODE REQUIREMENTS
@@ -486,7 +497,7 @@ COMMON_STYLESHEET_TEMPLATE = """
   QDialog, QWidget {{
     background-color: {widget_bg};
   }}
-  QTextEdit {{
+  QTextEdit, QPlainTextEdit {{
     background-color: {log_view_bg};
     color: {log_view_text};
     font-size: {font_size};
@@ -346,20 +346,16 @@ class _DockerUtilsMixin:
             - error_message: str with error details if any, None otherwise
     """
     self.add_log('Checking Docker status...')
+    # A single `docker version` both proves the CLI is installed and queries the
+    # daemon's /version endpoint; it exits non-zero when the daemon is unreachable
+    command = ['docker', 'version', '--format', '{{.Client.Version}} {{.Server.Version}}']
     try:
-        # First check if Docker is installed
         if os.name == 'nt':
-            output = subprocess.check_output(['docker', '--version'], stderr=subprocess.STDOUT, universal_newlines=True, creationflags=subprocess.CREATE_NO_WINDOW)
+            output = subprocess.check_output(command, stderr=subprocess.STDOUT, universal_newlines=True, creationflags=subprocess.CREATE_NO_WINDOW)
         else:
-            output = subprocess.check_output(['docker', '--version'], stderr=subprocess.STDOUT, universal_newlines=True)
-        self.add_log("Docker version: " + output.strip())
-        
-        # Then check if Docker daemon is running
-        if os.name == 'nt':
-            subprocess.check_output(['docker', 'info'], stderr=subprocess.STDOUT, universal_newlines=True, creationflags=subprocess.CREATE_NO_WINDOW)
-        else:
-            subprocess.check_output(['docker', 'info'], stderr=subprocess.STDOUT, universal_newlines=True)
-        
+            output = subprocess.check_output(command, stderr=subprocess.STDOUT, universal_newlines=True)
+        client_version, _, server_version = output.strip().partition(' ')
+        self.add_log(f"Docker version: client {client_version}, server {server_version}")
         self.add_log("Docker daemon is running")
         return True, True, None
     except FileNotFoundError:
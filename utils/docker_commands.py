@@ -1,10 +1,12 @@
 import os
 import json
+import shlex
 import subprocess
+from collections import deque
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 import logging
 import platform
 import time
@@ -21,10 +23,20 @@ from utils.const import DOCKER_VOLUME_PATH
 DOCKER_IMAGE = "ratio1/edge_node:mainnet"
 DOCKER_TAG = "latest"
 
+# Shell script that prints node info and node history as one JSON document,
+# so both can be fetched with a single docker exec
+NODE_INFO_AND_HISTORY_SCRIPT = (
+    "printf '{\"info\":' && get_node_info && "
+    "printf ',\"history\":' && get_node_history && printf '}'"
+)
+
 # Timeout configurations
 DEFAULT_TIMEOUT = 90  # Default timeout for commands in seconds
 REMOTE_TIMEOUT = 120   # Extended timeout for remote commands in seconds 
 THREAD_JOIN_TIMEOUT = 2  # Timeout for thread joining in seconds
+PULL_CACHE_TTL = 300  # Seconds a successful image pull is considered current
+PULL_OUTPUT_INTERVAL_MS = 33  # Pull output is handed to the UI at most ~30 times per second
+DESTROY_WAIT_TIMEOUT = 2.0  # Seconds to wait for a container destroy event before moving on
 
 @dataclass
 class ContainerInfo:
@@ -114,12 +126,17 @@ class DockerCommandThread(QThread):
     command_finished = pyqtSignal(dict)
     command_error = pyqtSignal(str)
 
-    def __init__(self, container_name: str, command: str, input_data: str = None, remote_ssh_command: list = None):
+    def __init__(self, container_name: str, command: str, input_data: str = None, remote_ssh_command: list = None,
+                 parser=None, parse_error: str = "Failed to process response"):
         super().__init__()
         self.container_name = container_name
         self.command = command
         self.input_data = input_data
         self.remote_ssh_command = remote_ssh_command
+        # Optional callable that turns the decoded JSON into a model object in
+        # this thread, so the main thread only receives the finished result
+        self.parser = parser
+        self.parse_error = parse_error
         # Store the result to be processed in the main thread
         self.result_data = None
         self.error_message = None
@@ -129,7 +146,15 @@ class DockerCommandThread(QThread):
             full_command = ['docker', 'exec']
             if self.input_data is not None:
                 full_command.extend(['-i'])  # Add interactive flag when input is provided
-            full_command.extend([self.container_name] + self.command.split())
+            if isinstance(self.command, (list, tuple)):
+                # Pre-split command; ssh joins its arguments into one remote
+                # shell line, so quote them to keep each argument intact
+                command_args = list(self.command)
+                if self.remote_ssh_command:
+                    command_args = [shlex.quote(arg) for arg in command_args]
+            else:
+                command_args = self.command.split()
+            full_command.extend([self.container_name] + command_args)
 
             # Add remote prefix if needed
             if self.remote_ssh_command:
@@ -166,7 +191,7 @@ class DockerCommandThread(QThread):
                     return
                 
                 # If command is reset_address or change_alias, process output as plain text
-                if self.command == 'reset_address' or self.command.startswith('change_alias'):
+                if isinstance(self.command, str) and (self.command == 'reset_address' or self.command.startswith('change_alias')):
                     self.result_data = {'message': result.stdout.strip()}
                     return
                 
@@ -174,8 +199,18 @@ class DockerCommandThread(QThread):
                     self.result_data = json.loads(result.stdout)
                 except json.JSONDecodeError:
                     self.error_message = f"Error decoding JSON response. Raw output: {result.stdout}"
+                    return
                 except Exception as e:
                     self.error_message = f"Error processing response: {str(e)}\nRaw output: {result.stdout}"
+                    return
+
+                if self.parser is not None and self.result_data:
+                    try:
+                        self.result_data = self.parser(self.result_data)
+                    except Exception as e:
+                        logging.error(f"{self.parse_error}: {str(e)}")
+                        self.result_data = None
+                        self.error_message = f"{self.parse_error}: {str(e)}"
             except subprocess.TimeoutExpired as e:
                 error_msg = f"Command timed out after {e.timeout} seconds: {' '.join(full_command)}"
                 print(error_msg)
@@ -380,6 +415,44 @@ class DockerDirectCommandThread(QThread):
             traceback.print_exc()
             self.error_message = error_msg
 
+class DockerWorkerSignals(QObject):
+    """ Signals emitted by a DockerWorker, delivered on the receiver's (GUI) thread """
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class DockerWorker(QRunnable):
+    """ Runs a blocking call (Docker CLI, network request) on the global QThreadPool.
+
+    The callable must not touch any Qt widget; its return value is emitted
+    through `signals.result` and handled on the main thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = DockerWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logging.error(f"Docker worker failed: {str(e)}")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+    def start(self):
+        """Dispatch the worker to the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+        return self
+
+
 class DockerCommandHandler:
     """ Handles Docker commands """
     def __init__(self, container_name: str = None):
@@ -393,6 +466,7 @@ class DockerCommandHandler:
         self._debug_mode = False
         self.threads = []
         self.remote_ssh_command = None
+        self._last_pull_ts = {}  # image -> monotonic time of the last successful pull
 
     def set_debug_mode(self, enabled: bool) -> None:
         """Set debug mode for docker commands.
@@ -403,7 +477,9 @@ class DockerCommandHandler:
         self._debug_mode = enabled
 
     def set_container_name(self, container_name: str):
-        """Set the container name."""
+        """Set the container name (no-op when it is already selected)."""
+        if container_name == self.container_name:
+            return
         self.container_name = container_name
 
     def execute_command(self, command: list) -> tuple:
@@ -462,15 +538,53 @@ class DockerCommandHandler:
         # Use streaming thread for real-time updates
         thread = DockerStreamingCommandThread(pull_command, self.remote_ssh_command)
         
-        # Connect output signal to callback if provided
+        # Buffer output lines in the reader threads and hand them to the callback
+        # in batches from a UI timer, instead of one queued call per line
         if output_callback:
-            thread.output_received.connect(output_callback)
+            pending_lines = deque()
+            thread.output_received.connect(pending_lines.append, Qt.DirectConnection)
+            # Parented to the thread object (which lives in the GUI thread) so it is owned by Qt
+            output_timer = QTimer(thread)
+            output_timer.setInterval(PULL_OUTPUT_INTERVAL_MS)
+            output_timer.timeout.connect(lambda: self._drain_pull_output(pending_lines, output_callback))
+            output_timer.start()
+
+            def flush_output():
+                output_timer.stop()
+                self._drain_pull_output(pending_lines, output_callback)
+                output_timer.deleteLater()
+            thread.finished.connect(flush_output)
         
-        # Connect finished signal
+        # Connect finished signal; the pull is recorded before the callbacks run
+        thread.finished.connect(lambda: self._record_pull(thread))
         thread.finished.connect(lambda: self._handle_streaming_thread_finished(thread, callback, error_callback))
         
         self.threads.append(thread)  # Keep reference to prevent GC
         thread.start()
+
+    @staticmethod
+    def _drain_pull_output(pending_lines, output_callback):
+        """Pass every buffered pull output line to the callback, in order."""
+        while pending_lines:
+            output_callback(pending_lines.popleft())
+
+    def _record_pull(self, thread):
+        """Remember when DOCKER_IMAGE was last pulled successfully."""
+        if not thread.error_message and thread.result_data and thread.result_data[2] == 0:
+            self._last_pull_ts[DOCKER_IMAGE] = time.monotonic()
+
+    def needs_pull(self, image: str = DOCKER_IMAGE, ttl: float = PULL_CACHE_TTL) -> bool:
+        """Check whether an image should be pulled again before a launch.
+        
+        Args:
+            image: Image reference to check
+            ttl: Seconds a successful pull is considered current
+            
+        Returns:
+            bool: False if the image was pulled successfully less than ttl seconds ago
+        """
+        last_pull = self._last_pull_ts.get(image)
+        return last_pull is None or time.monotonic() - last_pull >= ttl
     
     def _handle_streaming_thread_finished(self, thread, callback, error_callback):
         """Handle streaming thread completion.
@@ -590,8 +704,10 @@ class DockerCommandHandler:
         """Clear remote connection settings."""
         self.remote_ssh_command = None
 
-    def _execute_threaded(self, command: str, callback, error_callback, input_data: str = None) -> None:
-        thread = DockerCommandThread(self.container_name, command, input_data, self.remote_ssh_command)
+    def _execute_threaded(self, command, callback, error_callback, input_data: str = None,
+                          parser=None, parse_error: str = "Failed to process response") -> None:
+        thread = DockerCommandThread(self.container_name, command, input_data, self.remote_ssh_command,
+                                     parser, parse_error)
         
         # Connect signals to slots that will safely emit signals in the main thread
         thread.finished.connect(lambda: self._handle_thread_finished(thread, callback, error_callback))
@@ -614,14 +730,15 @@ class DockerCommandHandler:
             self.threads.remove(thread)
 
     def get_node_info(self, callback, error_callback) -> None:
-        def process_node_info(data: dict):
+        def process_node_info(node_info: NodeInfo):
             try:
-                node_info = NodeInfo.from_dict(data)
                 callback(node_info)
             except Exception as e:
                 error_callback(f"Failed to process node info: {str(e)}")
 
-        self._execute_threaded('get_node_info', process_node_info, error_callback)
+        # NodeInfo is built in the worker thread; only the callback runs here
+        self._execute_threaded('get_node_info', process_node_info, error_callback,
+                               parser=NodeInfo.from_dict, parse_error="Failed to process node info")
 
     def get_node_history(self, callback, error_callback) -> None:
         """Get node history metrics.
@@ -636,26 +753,48 @@ class DockerCommandHandler:
                 error_callback("No container name specified")
                 return
                 
-            def process_metrics(data: dict):
+            def parse_metrics(data: dict) -> NodeHistory:
+                # Runs in the worker thread
+                logging.info(f"Processing metrics data: {data.keys() if isinstance(data, dict) else type(data)}")
+                return NodeHistory.from_dict(data)
+
+            def process_metrics(metrics: NodeHistory):
                 try:
-                    if not data:
-                        error_callback("No data returned from container")
-                        return
-                        
-                    logging.info(f"Processing metrics data: {data.keys() if isinstance(data, dict) else type(data)}")
-                    metrics = NodeHistory.from_dict(data)
                     callback(metrics)
                 except Exception as e:
-                    import traceback
                     logging.error(f"Failed to process metrics: {str(e)}")
-                    logging.error(traceback.format_exc())
                     error_callback(f"Failed to process metrics: {str(e)}")
 
-            self._execute_threaded('get_node_history', process_metrics, error_callback)
+            self._execute_threaded('get_node_history', process_metrics, error_callback,
+                                   parser=parse_metrics, parse_error="Failed to process metrics")
         except Exception as e:
             logging.error(f"Error in get_node_history: {str(e)}")
             error_callback(f"Error getting node history: {str(e)}")
 
+    def get_node_info_and_history(self, info_callback, history_callback, error_callback) -> None:
+        """Get node info and node history metrics with a single docker exec.
+
+        Args:
+            info_callback: Success callback that receives a NodeInfo object
+            history_callback: Success callback that receives a NodeHistory object
+            error_callback: Error callback that receives error message
+        """
+        if not self.container_name:
+            error_callback("No container name specified")
+            return
+
+        def parse_combined(data: dict) -> tuple:
+            # Runs in the worker thread
+            return NodeInfo.from_dict(data['info']), NodeHistory.from_dict(data['history'])
+
+        def process_combined(result: tuple):
+            node_info, metrics = result
+            info_callback(node_info)
+            history_callback(metrics)
+
+        self._execute_threaded(['sh', '-c', NODE_INFO_AND_HISTORY_SCRIPT], process_combined, error_callback,
+                               parser=parse_combined, parse_error="Failed to process node info and metrics")
+
     def get_allowed_addresses(self, callback, error_callback) -> None:
         """Get allowed addresses.
         
@@ -843,6 +982,65 @@ class DockerCommandHandler:
         # Remove from registry
         self.registry.remove_container(name)
 
+    def remove_container_threaded(self, container_id: str, callback, error_callback) -> None:
+        """Force-remove a container in a background thread.
+        
+        Args:
+            container_id: Name or ID of the container to remove
+            callback: Function to call with result tuple (stdout, stderr, return_code)
+            error_callback: Function to call on error with error message
+        """
+        self._execute_direct_threaded(['docker', 'rm', '-f', container_id], callback, error_callback)
+
+    def wait_for_destroy(self, container_id: str, callback, since: float = None,
+                         timeout: float = DESTROY_WAIT_TIMEOUT) -> None:
+        """Call `callback` once Docker reports the container destroyed, or after `timeout`.
+        
+        Listens on `docker events` starting at `since` (epoch seconds, default now),
+        so a destroy that already happened, e.g. during a finished `docker rm -f`,
+        is replayed immediately instead of being waited for.
+        
+        Args:
+            container_id: Name or ID of the container
+            callback: Function called once, without arguments, on the main thread
+            since: Epoch time from which events are replayed
+            timeout: Seconds after which the callback runs anyway
+        """
+        since = int(since if since is not None else time.time()) - 1
+        # --until also bounds the stream on the docker side (e.g. over SSH)
+        until = int(time.time() + timeout) + 1
+        command = ['docker', 'events', '--since', str(since), '--until', str(until),
+                   '--filter', f'container={container_id}', '--filter', 'event=destroy',
+                   '--format', '{{.ID}}']
+        thread = DockerStreamingCommandThread(command, self.remote_ssh_command)
+        timer = QTimer()
+        timer.setSingleShot(True)
+        done = False
+
+        def finish(*_):
+            nonlocal done
+            if done:
+                return
+            done = True
+            timer.stop()
+            thread.terminate_process()
+            callback()
+
+        def cleanup():
+            if thread in self.threads:
+                self.threads.remove(thread)
+
+        # The first destroy event, the timeout or the stream ending, whichever comes first
+        thread.output_received.connect(finish)
+        timer.timeout.connect(finish)
+        thread.finished.connect(finish)
+        thread.finished.connect(cleanup)
+
+        self._track_thread(thread)
+        self.threads.append(thread)  # Keep reference to prevent GC
+        thread.start()
+        timer.start(int(timeout * 1000))
+
     def inspect_container(self, container_name: str = None) -> dict:
         """Get detailed information about a container.
         
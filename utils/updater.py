@@ -5,17 +5,36 @@ import zipfile
 import shutil
 import platform
 import subprocess
+from time import monotonic
 from PyQt5.QtWidgets import QMessageBox, QApplication
 
 from utils.const import GITHUB_API_URL
 from ver import __VER__ as CURRENT_VERSION
 
 DOWNLOAD_DIR = 'downloads'
+RELEASE_CACHE_TTL = 600  # Seconds a fetched latest release is reused before asking GitHub again
+
+# (monotonic() of the fetch, (latest_version, download_urls)) of the last GitHub query
+_release_cache = None
+
+
+def cached_latest_release():
+  """Return the (latest_version, download_urls) fetched less than RELEASE_CACHE_TTL ago, or None."""
+  cached = _release_cache
+  if cached is not None and monotonic() - cached[0] < RELEASE_CACHE_TTL:
+    return cached[1]
+  return None
+
 
 class _UpdaterMixin:
 
   @staticmethod
   def get_latest_release_version():
+    global _release_cache
+    cached = cached_latest_release()
+    if cached is not None:
+      return cached
+
     response = requests.get(GITHUB_API_URL)
     response.raise_for_status()
     latest_release = response.json()
@@ -38,6 +57,7 @@ class _UpdaterMixin:
     # Remove None values (assets that don't exist)
     download_urls = {k: v for k, v in download_urls.items() if v is not None}
     
+    _release_cache = (monotonic(), (latest_version, download_urls))
     return latest_version, download_urls
 
   def _compare_versions(self, current_version, latest_version):
@@ -414,17 +434,7 @@ echo Done.
         try:
             import os
             self.add_log("Using OS-level force exit for GUI application", debug=True)
-            if os.name == 'nt':  # Windows
-                # On Windows, use taskkill to force close only our GUI process
-                import subprocess
-                current_pid = os.getpid()
-                try:
-                    # Kill only the current GUI process
-                    subprocess.run(['taskkill', '/F', '/PID', str(current_pid)], 
-                                 capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
-                except:
-                    pass
-            # Fallback for all platforms
+            # os._exit ends only this process on all platforms, no taskkill needed
             os._exit(0)
         except:
             # Last resort - this should never fail
@@ -443,10 +453,11 @@ echo Done.
 
   def check_for_updates(self, verbose=True):
     try:
+      cached = cached_latest_release() is not None
       latest_version, download_urls = self.get_latest_release_version()
       latest_version = latest_version.lstrip('v').strip().replace('"', '').replace("'", '')
       if verbose:
-        self.add_log(f'Obtained latest version: {latest_version}')
+        self.add_log(f'Obtained latest version: {latest_version}{" (cached)" if cached else ""}')
       if self._compare_versions(CURRENT_VERSION, latest_version):
         reply = QMessageBox.question(None, 'Update Available',
                                     f'A new version v{latest_version} is available (current v{CURRENT_VERSION}). Do you want to update?',
@@ -1,7 +1,7 @@
 from PyQt5.QtWidgets import QComboBox, QStyledItemDelegate, QApplication, QWidget, QStylePainter, QStyle, QStyleOptionComboBox
 from PyQt5.QtCore import Qt, QObject, QEvent, QTimer, QRect, QSize
 from PyQt5.QtGui import QFontMetrics, QPainter, QPalette, QIcon, QColor
-from utils.const import DARK_STYLESHEET, DARK_COLORS, LIGHT_COLORS
+from utils.const import DARK_COLORS, LIGHT_COLORS
 
 class NoDecorationsDelegate(QStyledItemDelegate):
     """A delegate that removes all decorations and indicators from combo box items"""
@@ -246,9 +246,9 @@ class CenteredComboBox(QComboBox):
         # Get the main window
         parent = self.parent()
         while parent is not None:
-            # Check if this parent has the _current_stylesheet attribute 
-            if hasattr(parent, '_current_stylesheet'):
-                return parent._current_stylesheet == DARK_STYLESHEET
+            # The main window caches its theme as a flag when it applies a stylesheet
+            if hasattr(parent, '_is_dark'):
+                return parent._is_dark
             parent = parent.parent()
         
         # Fallback to the application palette check if we can't find the main window
@@ -10,6 +10,12 @@ import logging
 from app_forms.frm_utils import LoadingIndicator
 from utils.const import DARK_STYLESHEET, LIGHT_COLORS, DARK_COLORS
 
+# Patterns used to parse `docker pull` output, compiled once at import
+_LAYER_RE = re.compile(r'([a-f0-9]{12}): (.*)')
+_DIGEST_RE = re.compile(r'(sha256:[a-f0-9]{64}): (.*)')
+_PERCENT_RE = re.compile(r'(\d+)%')
+_MB_PROGRESS_RE = re.compile(r'(\d+\.\d+)MB/(\d+\.\d+)MB')
+
 class DockerPullDialog(QDialog):
     """Dialog for Docker image pull progress."""
     
@@ -137,6 +143,9 @@ class DockerPullDialog(QDialog):
         self.layers = {}
         self.layer_widgets = {}
         self.total_layers = 0
+        # Progress logging checkpoints: layer id -> last logged percent, and the overall one
+        self._logged_progress = {}
+        self._logged_overall_progress = -10
     
     @pyqtSlot(str)
     def update_pull_progress(self, line):
@@ -156,8 +165,8 @@ class DockerPullDialog(QDialog):
             return
             
         # Match layer ID - handle both old and new Docker output formats
-        layer_match = re.search(r'([a-f0-9]{12}): (.*)', line)
-        digest_match = re.search(r'(sha256:[a-f0-9]{64}): (.*)', line)
+        layer_match = _LAYER_RE.search(line)
+        digest_match = _DIGEST_RE.search(line)
         
         if layer_match or digest_match:
             match = layer_match or digest_match
@@ -226,16 +235,16 @@ class DockerPullDialog(QDialog):
                 self.layer_widgets[layer_id]['status'].setText(status)
             
             # Check for progress information or completion status
-            progress_match = re.search(r'(\d+)%', status)
+            progress_match = _PERCENT_RE.search(status)
             if progress_match:
                 progress = int(progress_match.group(1))
                 self.layers[layer_id]['progress'] = progress
                 
                 # Log progress updates at 25% intervals to avoid excessive logging
-                prev_progress = getattr(self, f"_prev_progress_{layer_id}", -25)
+                prev_progress = self._logged_progress.get(layer_id, -25)
                 if progress >= prev_progress + 25 or progress == 100:
                     logging.info(f"Layer {layer_id}: {progress}% complete - Status: {status}")
-                    setattr(self, f"_prev_progress_{layer_id}", progress - (progress % 25))
+                    self._logged_progress[layer_id] = progress - (progress % 25)
                 
                 # Update progress bar
                 if layer_id in self.layer_widgets:
@@ -322,7 +331,7 @@ class DockerPullDialog(QDialog):
                 self.layer_widgets[line_hash]['status'].setText(status)
             
             # Check for progress information in newer format
-            progress_match = re.search(r'(\d+\.\d+)MB/(\d+\.\d+)MB', status)
+            progress_match = _MB_PROGRESS_RE.search(status)
             if progress_match:
                 current = float(progress_match.group(1))
                 total = float(progress_match.group(2))
@@ -345,6 +354,28 @@ class DockerPullDialog(QDialog):
             
 
     
+    def reset_for_new_pull(self):
+        """Clear the progress of a previous pull so the dialog can be shown again.
+        
+        Signal connections are kept.
+        """
+        for widgets in self.layer_widgets.values():
+            layer_layout = widgets['layout']
+            for key in ('label', 'progress', 'status'):
+                layer_layout.removeWidget(widgets[key])
+                widgets[key].deleteLater()
+            self.layer_layout.removeItem(layer_layout)
+            layer_layout.deleteLater()
+        self.layers = {}
+        self.layer_widgets = {}
+        self.total_layers = 0
+        # Forget the progress logging checkpoints of the previous pull
+        self._logged_progress = {}
+        self._logged_overall_progress = -10
+        
+        self.overall_progress.setValue(0)
+        self.set_message("Preparing to pull Docker image...")
+    
     def _update_overall_progress(self):
         """Update the overall progress based on layer progress."""
         if not self.total_layers:
@@ -354,10 +385,9 @@ class DockerPullDialog(QDialog):
         overall_percent = int(total_progress / self.total_layers)
         
         # Log overall progress at 10% intervals to avoid excessive logging
-        prev_overall_progress = getattr(self, "_prev_overall_progress", -10)
-        if overall_percent >= prev_overall_progress + 10 or overall_percent == 100:
+        if overall_percent >= self._logged_overall_progress + 10 or overall_percent == 100:
             logging.info(f"Docker pull overall progress: {overall_percent}% complete ({self.total_layers} layers)")
-            setattr(self, "_prev_overall_progress", overall_percent - (overall_percent % 10))
+            self._logged_overall_progress = overall_percent - (overall_percent % 10)
         
         self.overall_progress.setValue(overall_percent)
     
@@ -408,5 +438,6 @@ class DockerPullDialog(QDialog):
         # Emit the signal to notify the parent
         self.pull_complete.emit(success, message)
         
-        # Close the dialog automatically after a short delay
-        QTimer.singleShot(100, self.safe_close)
+        # Hide the dialog automatically after a short delay; the owner reuses it
+        # for the next pull via reset_for_new_pull
+        QTimer.singleShot(100, self.hide)
@@ -95,6 +95,10 @@ class LoadingDialog(QDialog):
         
         self.setLayout(layout)
         
+        # Latest progress message waiting for the next event-loop pass
+        self._pending_msg = None
+        self._flush_scheduled = False
+        
         # Start the loading animation
         self.loading_indicator.start()
     
@@ -134,17 +138,30 @@ class LoadingDialog(QDialog):
         QTimer.singleShot(100, self.deleteLater)
     
     @pyqtSlot(str)
-    def update_progress(self, message, process_events=True):
+    def update_progress(self, message, process_events=False):
         """Update the dialog with progress information.
         
+        Messages posted back-to-back are coalesced: only the latest one is
+        shown, once control returns to the event loop.
+        
         Args:
             message: Progress message to display
-            process_events: Whether to process Qt events after updating
+            process_events: Show the message now and process Qt events
         """
-        self.set_message(message)
+        self._pending_msg = message
         if process_events:
-            # Process events to ensure UI remains responsive
+            self._flush_progress()
             QApplication.processEvents()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Show the latest pending progress message."""
+        self._flush_scheduled = False
+        if self._pending_msg is not None:
+            self.set_message(self._pending_msg)
+            self._pending_msg = None
     
     @pyqtSlot()
     def keep_alive(self):